@@ -0,0 +1,7 @@
+"""Allow running MyGit with ``python -m src``"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
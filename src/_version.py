@@ -0,0 +1,3 @@
+"""Single source of truth for the MyGit version"""
+
+__version__ = "0.1.0"
@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import argparse
 import sys
 import os
-import logging
-from typing import Dict, Any, Optional, List
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, Optional, List
+
+from ._version import __version__
 
 # Configure logging
 def setup_logging(verbose: bool = False, log_file: Optional[Path] = None):
     """Setup logging configuration"""
+    import logging
+    
     log_level = logging.DEBUG if verbose else logging.INFO
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
@@ -23,6 +33,12 @@ def setup_logging(verbose: bool = False, log_file: Optional[Path] = None):
         handlers=handlers
     )
 
+class _NullLogger:
+    """Stand-in logger used when logging was not requested"""
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
 class Color:
     """ANSI color codes for terminal output"""
     RED = '\033[91m'
@@ -36,11 +52,17 @@ class Color:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# Colors are only used on an interactive terminal that has not opted out
+# (https://no-color.org/); --no-color clears this at startup
+_USE_COLOR = (
+    sys.stdout.isatty()
+    and os.environ.get('NO_COLOR') is None
+    and os.environ.get('TERM') != 'dumb'
+)
+
 def colorize(text: str, color: str) -> str:
     """Colorize text for terminal output"""
-    if not sys.stdout.isatty():
-        return text  # No colors if not in terminal
-    return f"{color}{text}{Color.END}"
+    return f"{color}{text}{Color.END}" if _USE_COLOR else text
 
 class CLIError(Exception):
     """Custom exception for CLI errors"""
@@ -56,6 +78,7 @@ class CommandRegistry:
             'inspection': ['cat-file', 'hash-object'],
             'advanced': [],  # Will be populated dynamically
         }
+        self._alias_to_name: Dict[str, str] = {}
     
     def register_command(self, name: str, func, parser_setup, 
                         category: str = 'basic', description: str = None,
@@ -66,8 +89,10 @@ class CommandRegistry:
             'parser_setup': parser_setup,
             'category': category,
             'description': description or f"{name} command",
-            'aliases': aliases or []
+            'aliases': tuple(aliases or ())
         }
+        for alias in aliases or ():
+            self._alias_to_name[alias] = name
         
         # Add to category
         if category not in self._categories:
@@ -77,16 +102,7 @@ class CommandRegistry:
     
     def get_command(self, name: str) -> Optional[Dict[str, Any]]:
         """Get command by name"""
-        # Check exact match first
-        if name in self._commands:
-            return self._commands[name]
-        
-        # Check aliases
-        for cmd_name, cmd_info in self._commands.items():
-            if name in cmd_info.get('aliases', []):
-                return cmd_info
-        
-        return None
+        return self._commands.get(name) or self._commands.get(self._alias_to_name.get(name))
     
     def list_commands(self, category: str = None) -> List[str]:
         """List all commands or commands in a category"""
@@ -107,30 +123,35 @@ class CommandRegistry:
             metavar="<command>"
         )
         
-        # Add commands grouped by category
-        for category in self.get_categories():
-            category_commands = self.list_commands(category)
-            if category_commands:
-                for cmd_name in sorted(category_commands):
-                    cmd_info = self._commands[cmd_name]
-                    cmd_parser = subparsers.add_parser(
-                        cmd_name,
-                        help=cmd_info['description'],
-                        aliases=cmd_info.get('aliases', []),
-                        description=cmd_info['description']
-                    )
-                    cmd_info['parser_setup'](cmd_parser)
-                    cmd_parser.set_defaults(func=cmd_info['func'])
+        # Register each command exactly once, in name order
+        for cmd_name in sorted(self._commands):
+            cmd_info = self._commands[cmd_name]
+            cmd_parser = subparsers.add_parser(
+                cmd_name,
+                help=cmd_info['description'],
+                aliases=cmd_info['aliases'],
+                description=cmd_info['description']
+            )
+            cmd_info['parser_setup'](cmd_parser)
 
 class ProgressIndicator:
     """Shows progress for long-running operations"""
     
+    BAR_LENGTH = 30
+    RENDER_INTERVAL_NS = 50_000_000  # Redraw at most every 50ms
+    
     def __init__(self, message: str, total: int = 100):
         self.message = message
         self.total = total
         self.current = 0
         self._spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self._spinner_index = 0
+        self._full_bar = '█' * self.BAR_LENGTH
+        self._empty_bar = '░' * self.BAR_LENGTH
+        self._last_render_ns = 0
+        
+        if not sys.stderr.isatty():
+            self._render = lambda: None  # No progress bars if not in terminal
     
     def update(self, progress: int, message: str = None):
         """Update progress"""
@@ -147,14 +168,16 @@ class ProgressIndicator:
         self._render()
     
     def _render(self):
-        """Render progress indicator"""
-        if not sys.stderr.isatty():
-            return  # No progress bars if not in terminal
+        """Render progress indicator, throttled to RENDER_INTERVAL_NS"""
+        now = time.monotonic_ns()
+        if (now - self._last_render_ns < self.RENDER_INTERVAL_NS
+                and self.current != self.total):
+            return
+        self._last_render_ns = now
         
         percentage = (self.current / self.total) * 100 if self.total > 0 else 0
-        bar_length = 30
-        filled_length = int(bar_length * self.current // self.total)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        filled = int(self.BAR_LENGTH * self.current / self.total) if self.total > 0 else 0
+        bar = self._full_bar[:filled] + self._empty_bar[filled:]
         
         spinner = self._spinner_chars[self._spinner_index]
         self._spinner_index = (self._spinner_index + 1) % len(self._spinner_chars)
@@ -180,11 +203,10 @@ class ProgressIndicator:
         else:
             self.finish("Failed!")
 
-def print_banner():
-    """Print MyGit banner with platform-specific characters"""
-    import platform
-    
-    if platform.system() == 'Windows':
+@lru_cache(maxsize=2)
+def _render_banner(windows: bool, use_color: bool) -> str:
+    """Build the MyGit banner; cached per platform style and color mode"""
+    if windows:
         # ASCII banner for Windows - properly aligned
         banner = f"""
 {colorize('=' * 35, Color.CYAN)}
@@ -200,11 +222,16 @@ def print_banner():
 {colorize('║', Color.CYAN)}        Educational Git Implementation        {colorize('║', Color.CYAN)}
 {colorize('╚════════════════════════════════════════════╝', Color.CYAN)}
 """
-    print(banner)
+    return banner
 
-def print_usage_examples():
-    """Print usage examples"""
-    examples = f"""
+def print_banner():
+    """Print MyGit banner with platform-specific characters"""
+    print(_render_banner(sys.platform.startswith('win'), _USE_COLOR))
+
+@lru_cache(maxsize=2)
+def _build_usage_examples(use_color: bool) -> str:
+    """Build the usage examples text; cached per color mode"""
+    return f"""
 {colorize('Usage Examples:', Color.BOLD + Color.YELLOW)}
 
 {colorize('Basic Workflow:', Color.CYAN)}
@@ -221,7 +248,10 @@ def print_usage_examples():
   {colorize('mygit --verbose add .', Color.GREEN)}               {colorize('# Verbose output', Color.WHITE)}
   {colorize('mygit --log-file debug.log commit', Color.GREEN)}   {colorize('# Log to file', Color.WHITE)}
 """
-    print(examples)
+
+def print_usage_examples():
+    """Print usage examples"""
+    print(_build_usage_examples(_USE_COLOR))
 
 def handle_keyboard_interrupt():
     """Handle Ctrl+C gracefully"""
@@ -234,15 +264,33 @@ def check_python_version():
         print(f"{colorize('Error: MyGit requires Python 3.7 or higher', Color.RED)}")
         sys.exit(1)
 
-def load_commands() -> CommandRegistry:
-    """Load and register all commands"""
+# Global options that consume the following argv token
+_GLOBAL_OPTIONS_WITH_VALUE = ('--log-file',)
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the first non-option token after the global options, if any"""
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(tokens, None)
+        elif not token.startswith('-'):
+            return token
+    return None
+
+def load_commands(names: Optional[List[str]] = None) -> CommandRegistry:
+    """
+    Load and register all commands, or only the given command names.
+    Names that are not built-in commands (typos, aliases) load them all.
+    """
     registry = CommandRegistry()
     
     try:
         from .commands import COMMANDS
         
         # Register commands from the commands package
-        for cmd_name, (cmd_func, parser_setup) in COMMANDS.items():
+        selected = [name for name in names or () if name in COMMANDS]
+        for cmd_name in (selected or COMMANDS):
+            cmd_func, parser_setup = COMMANDS[cmd_name]
             # Determine category based on command name
             if cmd_name in ['init', 'add', 'commit', 'log']:
                 category = 'basic'
@@ -268,15 +316,17 @@ def load_commands() -> CommandRegistry:
 
 def main():
     """Main CLI entry point with enhanced functionality"""
-    import sys
-    
-    # Set up signal handler for Ctrl+C
-    import signal
-    signal.signal(signal.SIGINT, lambda sig, frame: handle_keyboard_interrupt())
+    global _USE_COLOR
     
     # Check Python version
     check_python_version()
     
+    # Trivial modes: answer before any parser or command is built
+    cmd = _sniff_subcommand(sys.argv)
+    if cmd is None and '--version' in sys.argv[1:]:
+        print(f"MyGit version {__version__}")
+        return 0
+    
     # Create main parser
     parser = argparse.ArgumentParser(
         description="MyGit - A minimal Git implementation in Python",
@@ -313,9 +363,10 @@ def main():
         help='Disable colored output'
     )
     
-    # Load commands and setup subparsers
+    # Load commands and setup subparsers. When the invoked command can be
+    # recognised up front, only its module and parser are loaded.
     try:
-        registry = load_commands()
+        registry = load_commands([cmd] if cmd else None)
         registry.setup_parser(parser)
     except CLIError as e:
         print(f"{colorize(f'Error: {e}', Color.RED)}")
@@ -324,42 +375,54 @@ def main():
     # Parse arguments
     if len(sys.argv) == 1:
         print_banner()
-        print_usage_examples()
+        if sys.stdout.isatty():
+            print_usage_examples()
+        parser.print_help()
+        return 0
+    
+    if sys.argv[1:] in (['-h'], ['--help']):
+        print_banner()
         parser.print_help()
         return 0
     
     args = parser.parse_args()
     
     # Handle global options
-    if args.help and not hasattr(args, 'func'):
+    if args.help and not args.command:
         print_banner()
         parser.print_help()
         return 0
     
     if args.version:
-        from . import __version__
         print(f"MyGit version {__version__}")
         return 0
     
     if args.no_color:
-    # Disable colors by replacing colorize function
-    # Use a different approach to avoid global declaration issues
-        import types
-        import sys
-        # Create a new module-level colorize function that doesn't use colors
-        sys.modules[__name__].colorize = lambda text, color: text
+        _USE_COLOR = False
+    
+    from .commands import COMMANDS
     
-    # Setup logging
-    setup_logging(args.verbose, args.log_file)
-    logger = logging.getLogger('mygit')
+    # Setup logging only when it was asked for
+    if args.verbose or args.log_file:
+        import logging
+        setup_logging(args.verbose, args.log_file)
+        logger = logging.getLogger('mygit')
+    else:
+        logger = _NullLogger()
     
     try:
         # Execute command
-        if hasattr(args, 'func'):
+        func, _ = COMMANDS.get(args.command, (None, None))
+        if func is not None:
             logger.debug(f"Executing command: {args.command}")
             logger.debug(f"Command arguments: {args}")
             
-            success = args.func(args)
+            # Set up signal handler for Ctrl+C on interactive sessions
+            if sys.stdin.isatty():
+                import signal
+                signal.signal(signal.SIGINT, lambda sig, frame: handle_keyboard_interrupt())
+            
+            success = func(args)
             if success:
                 logger.debug("Command completed successfully")
                 return 0
@@ -369,7 +432,7 @@ def main():
         else:
             # No command specified but not help/version
             if args.command:
-                print(f"{colorize(f'Error: Unknown command "{args.command}"', Color.RED)}")
+                print(colorize(f'Error: Unknown command "{args.command}"', Color.RED))
                 print(f"Run {colorize('mygit --help', Color.CYAN)} for available commands.")
             else:
                 parser.print_help()
@@ -7,7 +7,8 @@ Git commands with advanced features like aliases, categories, and dynamic loadin
 """
 
 import importlib
-import inspect
+import sys
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Dict, List, Tuple, Callable, Any, Optional, Type
 from enum import Enum
@@ -23,6 +24,40 @@ class CommandCategory(Enum):
     INTERNAL = "internal"     # Internal/plumbing commands
     EXPERIMENTAL = "experimental" # Experimental features
 
+# Module, function and parser setup for each built-in command, resolved
+# only when the command is actually used
+_COMMAND_SPECS = {
+    'init': ('.init', 'cmd_init', 'setup_parser'),
+    'hash-object': ('.hash_object', 'cmd_hash_object', 'setup_parser'),
+    'cat-file': ('.cat_file', 'cmd_cat_file', 'setup_parser'),
+    'add': ('.add', 'cmd_add', 'setup_parser'),
+    'commit': ('.commit', 'cmd_commit', 'setup_parser'),
+    'log': ('.log', 'cmd_log', 'setup_parser'),
+}
+
+class _LazyCallable:
+    """Callable that imports its target function on first use"""
+    
+    __slots__ = ('module_name', 'attr', '_target')
+    
+    def __init__(self, module_name: str, attr: str):
+        self.module_name = module_name
+        self.attr = attr
+        self._target = None
+    
+    def resolve(self) -> Callable:
+        """Import the owning module and return the real function"""
+        if self._target is None:
+            module = importlib.import_module(self.module_name, __name__)
+            self._target = getattr(module, self.attr)
+        return self._target
+    
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+    
+    def __repr__(self) -> str:
+        return f"_LazyCallable({self.module_name}:{self.attr})"
+
 class CommandMetadata:
     """Metadata container for command information"""
     
@@ -37,12 +72,13 @@ class CommandMetadata:
                  enabled: bool = True,
                  experimental: bool = False,
                  min_repo_version: str = None):
-        self.name = name
+        # Interned so registry lookups with literal names compare by identity
+        self.name = sys.intern(name)
         self.function = function
         self.parser_setup = parser_setup
         self.category = category
         self.description = description or f"{name} command"
-        self.aliases = aliases or []
+        self.aliases = {sys.intern(alias) for alias in aliases or ()}
         self.version = version
         self.enabled = enabled
         self.experimental = experimental
@@ -54,7 +90,7 @@ class CommandMetadata:
             'name': self.name,
             'category': self.category.value,
             'description': self.description,
-            'aliases': self.aliases,
+            'aliases': tuple(sorted(self.aliases)),
             'version': self.version,
             'enabled': self.enabled,
             'experimental': self.experimental,
@@ -64,6 +100,8 @@ class CommandMetadata:
     def __repr__(self) -> str:
         return f"CommandMetadata({self.name}, category={self.category.value})"
 
+_EMPTY_BUCKET: Dict[str, CommandMetadata] = {}
+
 class CommandRegistry:
     """
     Registry for managing Git commands with advanced features including
@@ -72,7 +110,12 @@ class CommandRegistry:
     
     def __init__(self):
         self._commands: Dict[str, CommandMetadata] = {}
-        self._aliases: Dict[str, str] = {}  # alias -> command_name
+        self._aliases: Dict[str, CommandMetadata] = {}  # alias -> metadata
+        # len(name) -> {name or alias -> metadata}; buckets hold only a
+        # handful of keys, so a miss on length never hashes the name
+        self._by_len: Dict[int, Dict[str, CommandMetadata]] = {}
+        # (category, include_experimental, include_disabled) -> sorted names
+        self._list_cache: Dict[Tuple, Tuple[str, ...]] = {}
         self._categories: Dict[CommandCategory, List[str]] = {}
         self._initialized = False
     
@@ -112,13 +155,18 @@ class CommandRegistry:
             experimental=experimental
         )
         
+        name = metadata.name
         self._commands[name] = metadata
+        self._by_len.setdefault(len(name), {})[name] = metadata
+        self._list_cache.clear()
         
         # Register aliases
         for alias in metadata.aliases:
             if alias in self._aliases:
-                raise ValueError(f"Alias '{alias}' already registered for command '{self._aliases[alias]}'")
-            self._aliases[alias] = name
+                raise ValueError(f"Alias '{alias}' already registered for command '{self._aliases[alias].name}'")
+            self._aliases[alias] = metadata
+            # Primary names win
+            self._by_len.setdefault(len(alias), {}).setdefault(alias, metadata)
         
         # Add to category
         if category not in self._categories:
@@ -128,16 +176,7 @@ class CommandRegistry:
     
     def get_command(self, name: str) -> Optional[CommandMetadata]:
         """Get command metadata by name or alias"""
-        # Check exact match first
-        if name in self._commands:
-            return self._commands[name]
-        
-        # Check aliases
-        if name in self._aliases:
-            actual_name = self._aliases[name]
-            return self._commands.get(actual_name)
-        
-        return None
+        return self._by_len.get(len(name), _EMPTY_BUCKET).get(name)
     
     def get_command_function(self, name: str) -> Optional[Callable]:
         """Get command function by name or alias"""
@@ -154,6 +193,11 @@ class CommandRegistry:
                      include_experimental: bool = False,
                      include_disabled: bool = False) -> List[str]:
         """List commands with filtering options"""
+        key = (category, include_experimental, include_disabled)
+        cached = self._list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
         if category:
             command_names = self._categories.get(category, [])
         else:
@@ -168,7 +212,9 @@ class CommandRegistry:
                 continue
             filtered_commands.append(name)
         
-        return sorted(filtered_commands)
+        result = tuple(sorted(filtered_commands))
+        self._list_cache[key] = result
+        return list(result)
     
     def list_commands_with_metadata(self, 
                                    category: CommandCategory = None,
@@ -194,6 +240,7 @@ class CommandRegistry:
         metadata = self.get_command(name)
         if metadata:
             metadata.enabled = True
+            self._list_cache.clear()
             return True
         return False
     
@@ -202,6 +249,7 @@ class CommandRegistry:
         metadata = self.get_command(name)
         if metadata:
             metadata.enabled = False
+            self._list_cache.clear()
             return True
         return False
     
@@ -212,19 +260,23 @@ class CommandRegistry:
         if alias in self._aliases:
             return False
         
-        self._aliases[alias] = command_name
-        self._commands[command_name].aliases.append(alias)
+        metadata = self._commands[command_name]
+        alias = sys.intern(alias)
+        self._aliases[alias] = metadata
+        self._by_len.setdefault(len(alias), {}).setdefault(alias, metadata)
+        metadata.aliases.add(alias)
         return True
     
     def remove_alias(self, alias: str) -> bool:
         """Remove a command alias"""
-        if alias not in self._aliases:
+        metadata = self._aliases.pop(alias, None)
+        if metadata is None:
             return False
         
-        command_name = self._aliases[alias]
-        if command_name in self._commands:
-            self._commands[command_name].aliases.remove(alias)
-        del self._aliases[alias]
+        metadata.aliases.discard(alias)
+        bucket = self._by_len.get(len(alias), _EMPTY_BUCKET)
+        if bucket.get(alias) is metadata:
+            del bucket[alias]
         return True
     
     def load_commands_from_module(self, module_name: str) -> None:
@@ -252,39 +304,48 @@ class CommandRegistry:
     
     def _discover_commands_in_module(self, module) -> None:
         """Discover and register commands in a module"""
-        for name, obj in inspect.getmembers(module):
-            if (name.startswith('cmd_') and 
-                inspect.isfunction(obj) and 
-                not name.startswith('_')):
+        # Plain namespace walk: inspect.getmembers() would sort and getattr
+        # every attribute of the module
+        namespace = vars(module)
+        parser_func = namespace.get('setup_parser')
+        if not callable(parser_func):
+            return
+        
+        for name, obj in namespace.items():
+            if (name.startswith('cmd_') and
+                callable(obj) and
+                getattr(obj, '__module__', None) == module.__name__):
                 
                 command_name = name[4:].replace('_', '-')
-                parser_func_name = f"setup_parser"
-                parser_func = getattr(module, parser_func_name, None)
                 
-                if parser_func and inspect.isfunction(parser_func):
-                    # Extract description from docstring
-                    description = obj.__doc__ or f"Execute {command_name} command"
-                    description = description.strip().split('\n')[0] if description else ""
-                    
-                    self.register_command(
-                        name=command_name,
-                        function=obj,
-                        parser_setup=parser_func,
-                        description=description
-                    )
+                # Extract description from docstring
+                description = obj.__doc__ or f"Execute {command_name} command"
+                description = description.strip().split('\n')[0] if description else ""
+                
+                self.register_command(
+                    name=command_name,
+                    function=obj,
+                    parser_setup=parser_func,
+                    description=description
+                )
     
     def initialize_default_commands(self) -> None:
         """Initialize with default MyGit commands"""
         if self._initialized:
             return
         
-        # Import and register core commands
-        from .init import cmd_init, setup_parser as init_parser
-        from .hash_object import cmd_hash_object, setup_parser as hash_object_parser  
-        from .cat_file import cmd_cat_file, setup_parser as cat_file_parser
-        from .add import cmd_add, setup_parser as add_parser
-        from .commit import cmd_commit, setup_parser as commit_parser
-        from .log import cmd_log, setup_parser as log_parser
+        # Register core commands; their modules are imported on first call
+        def lazy(name: str) -> Tuple[_LazyCallable, _LazyCallable]:
+            module_name, func_name, parser_name = _COMMAND_SPECS[name]
+            return (_LazyCallable(module_name, func_name),
+                    _LazyCallable(module_name, parser_name))
+        
+        cmd_init, init_parser = lazy('init')
+        cmd_hash_object, hash_object_parser = lazy('hash-object')
+        cmd_cat_file, cat_file_parser = lazy('cat-file')
+        cmd_add, add_parser = lazy('add')
+        cmd_commit, commit_parser = lazy('commit')
+        cmd_log, log_parser = lazy('log')
         
         # Register commands with proper categorization
         self.register_command(
@@ -345,9 +406,19 @@ class CommandRegistry:
 
 # Global command registry instance
 _registry = CommandRegistry()
+_plugins_loaded = False
 
 def get_registry() -> CommandRegistry:
-    """Get the global command registry"""
+    """Get the global command registry, registering defaults on first use"""
+    global _plugins_loaded
+    _registry.initialize_default_commands()
+    if not _plugins_loaded:
+        _plugins_loaded = True
+        try:
+            register_plugin_commands(_registry)
+        except Exception:
+            # Silently fail plugin registration to not break core functionality
+            pass
     return _registry
 
 def initialize_commands() -> None:
@@ -356,25 +427,46 @@ def initialize_commands() -> None:
 
 def register_command(name: str, function: Callable, parser_setup: Callable, **kwargs) -> None:
     """Convenience function to register a command"""
-    _registry.register_command(name, function, parser_setup, **kwargs)
+    get_registry().register_command(name, function, parser_setup, **kwargs)
 
 def get_command_function(name: str) -> Optional[Callable]:
     """Get command function by name"""
-    return _registry.get_command_function(name)
+    return get_registry().get_command_function(name)
 
 def list_commands(category: CommandCategory = None, **kwargs) -> List[str]:
     """List available commands"""
-    return _registry.list_commands(category, **kwargs)
+    return get_registry().list_commands(category, **kwargs)
 
-# Initialize default commands
-initialize_commands()
+class _LazyCommands(Mapping):
+    """Read-only name -> (function, parser_setup) table that imports on lookup"""
+    
+    def __init__(self, specs: Dict[str, Tuple[str, str, str]]):
+        self._specs = specs
+        self._resolved: Dict[str, Tuple[Callable, Callable]] = {}
+    
+    def __getitem__(self, name: str) -> Tuple[Callable, Callable]:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+        
+        module_name, func_name, parser_name = self._specs[name]
+        module = importlib.import_module(module_name, __name__)
+        entry = (getattr(module, func_name), getattr(module, parser_name))
+        self._resolved[name] = entry
+        return entry
+    
+    def __iter__(self):
+        return iter(self._specs)
+    
+    def __len__(self) -> int:
+        return len(self._specs)
+    
+    def __contains__(self, name) -> bool:
+        return name in self._specs
 
-# Legacy COMMANDS dictionary for backward compatibility
-COMMANDS = {}
-for cmd_name in _registry.list_commands():
-    metadata = _registry.get_command(cmd_name)
-    if metadata:
-        COMMANDS[cmd_name] = (metadata.function, metadata.parser_setup)
+# Legacy COMMANDS table for backward compatibility
+COMMANDS = _LazyCommands(_COMMAND_SPECS)
 
 # Export public API
 __all__ = [
@@ -397,13 +489,6 @@ def register_plugin_commands(registry: CommandRegistry) -> None:
     """
     pass
 
-# Auto-discover and register plugin commands
-try:
-    register_plugin_commands(_registry)
-except Exception as e:
-    # Silently fail plugin registration to not break core functionality
-    pass
-
 # Version information
 __version__ = "1.0.0"
 __author__ = "MyGit Development Team"
@@ -1,8 +1,55 @@
 import argparse
+import glob
+import os
+import re
 from pathlib import Path
 from ..repository import Repository
-from ..objects.blob import Blob
-from ..objects.factory import ObjectFactory
+from ..objects.base import store_blobs
+
+# Characters that make an argument a glob pattern
+_GLOB_MAGIC = re.compile(r'[*?[]')
+
+def _expand_arguments(file_args, gitdir_name: str):
+    """
+    Resolve command line arguments to (display name, path) pairs.
+    
+    Glob patterns are expanded relative to the working directory. Repeated
+    arguments are resolved once, and a file matched by several arguments
+    is only returned for the first of them.
+    """
+    files = []
+    seen = set()
+    
+    for file_pattern in dict.fromkeys(file_args):
+        if _GLOB_MAGIC.search(file_pattern):
+            matches = sorted(
+                path for path in map(Path, glob.glob(file_pattern, recursive=True))
+                if gitdir_name not in path.parts and path.is_file()
+            )
+            if not matches:
+                print(f"Warning: '{file_pattern}' matches no files")
+                continue
+        else:
+            path = Path(file_pattern)
+            
+            # One stat for the common case; the rest only sorts out the
+            # message for arguments that are skipped anyway
+            if path.is_file():
+                matches = [path]
+            elif path.exists():
+                print(f"Skipping {file_pattern} (not a file)")
+                continue
+            else:
+                print(f"Warning: '{file_pattern}' matches no files")
+                continue
+        
+        for path in matches:
+            key = os.path.normpath(path)
+            if key not in seen:
+                seen.add(key)
+                files.append((str(path), path))
+    
+    return files
 
 def cmd_add(args):
     """Add file contents to the staging area"""
@@ -13,27 +60,18 @@ def cmd_add(args):
         return False
     
     try:
-        factory = ObjectFactory.get_instance()
-        added_count = 0
+        objects_dir = repo.gitdir / "objects"
+        objects_dir.mkdir(parents=True, exist_ok=True)
         
-        for file_pattern in args.files:
-            path = Path(file_pattern)
-            
-            if not path.exists():
-                print(f"Warning: '{file_pattern}' matches no files")
-                continue
-            
-            if path.is_file():
-                # Create blob from file
-                blob = Blob.from_file(str(path))
-                # Write object to repository
-                sha = factory.write_object(repo, blob)
-                
-                if args.verbose:
-                    print(f"Added {file_pattern} -> {sha[:8]}")
-                added_count += 1
-            else:
-                print(f"Skipping {file_pattern} (not a file)")
+        # Resolve arguments up front so the blobs can be written in parallel
+        files = _expand_arguments(args.files, repo.gitdir.name)
+        
+        shas = store_blobs([path for _, path in files], objects_dir)
+        
+        if args.verbose:
+            for (file_pattern, _), sha in zip(files, shas):
+                print(f"Added {file_pattern} -> {sha[:8]}")
+        added_count = len(shas)
         
         if added_count > 0:
             print(f"Added {added_count} file(s) to staging area")
@@ -1,13 +1,26 @@
 import argparse
+import bisect
+import codecs
+import itertools
+import operator
+import os
+import queue
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from ..repository import Repository
 from ..objects.factory import ObjectFactory
 from ..objects.blob import Blob
 from ..objects.tree import Tree
 from ..objects.commit import Commit
 
+# Shortest abbreviated SHA that is looked up in the object store
+MIN_SHORT_SHA_LENGTH = 4
+
 def cmd_cat_file(args):
     """Display contents and information about git objects"""
     repo = Repository()
@@ -35,7 +48,17 @@ def cmd_cat_file(args):
 def _process_single_object(repo: Repository, obj_hash: str, args) -> bool:
     """Process a single object based on command line options"""
     try:
-        obj = ObjectFactory.read_object(repo, obj_hash)
+        if MIN_SHORT_SHA_LENGTH <= len(obj_hash) < 40:
+            obj_hash = _handle_short_sha(repo, obj_hash) or obj_hash
+        
+        if args.stream and not (args.size or args.type or args.pretty_print):
+            # Raw content straight from the object file, never fully in memory
+            _stream_object_data(ObjectFactory.open_object_stream(repo, obj_hash))
+            return True
+        if args.pretty_print and _stream_text_blob(repo, obj_hash):
+            return True
+        
+        obj = ObjectFactory.get_instance().read_object(repo, obj_hash)
         
         if args.size:
             size = _get_object_size(obj)
@@ -49,12 +72,7 @@ def _process_single_object(repo: Repository, obj_hash: str, args) -> bool:
             return _pretty_print_object(obj, obj_hash, args)
         else:
             # Raw content
-            raw_data = obj.serialize()
-            if args.stream and hasattr(obj, 'data') and isinstance(obj.data, bytes):
-                # Stream large objects in chunks
-                _stream_object_data(obj.data)
-            else:
-                sys.stdout.buffer.write(raw_data)
+            sys.stdout.buffer.write(obj.serialize())
             return True
             
     except FileNotFoundError:
@@ -130,91 +148,236 @@ def _pretty_print_blob(blob: Blob, args):
 
 def _pretty_print_tree(tree: Tree, obj_hash: str, args):
     """Pretty print a tree object"""
-    if args.verbose:
-        print(f"tree {obj_hash}\n")
+    lines = [f"tree {obj_hash}\n\n"] if args.verbose else []
     
+    # Bind the per-entry lookups once for the loop
+    fields = operator.attrgetter('mode', 'name', 'sha')
+    type_of = _MODE_PREFIX_TYPE.get
+    append = lines.append
     for entry in tree.entries:
-        mode = entry.mode
-        obj_type = _mode_to_type(entry.mode)
-        name = entry.name
-        sha = entry.sha
-        
-        if args.verbose:
-            print(f"{mode} {obj_type} {sha}\t{name}")
-        else:
-            print(f"{mode} {obj_type} {sha}\t{name}")
+        mode, name, sha = fields(entry)
+        append(f"{mode} {type_of(mode[:3], 'unknown')} {sha}\t{name}\n")
+    
+    # One write instead of a print() per entry
+    sys.stdout.write(''.join(lines))
 
 def _pretty_print_commit(commit: Commit, obj_hash: str, args):
     """Pretty print a commit object"""
-    if args.verbose:
-        print(f"commit {obj_hash}\n")
+    lines = [f"commit {obj_hash}\n\n"] if args.verbose else []
     
-    print(f"tree {commit.tree}")
+    lines.append(f"tree {commit.tree}\n")
     for parent in commit.parents:
-        print(f"parent {parent}")
+        lines.append(f"parent {parent}\n")
     
-    print(f"author {commit.author}")
-    print(f"committer {commit.committer}")
+    lines.append(f"author {commit.author}\n")
+    lines.append(f"committer {commit.committer}\n")
     
     if hasattr(commit, 'timestamp') and commit.timestamp:
-        from datetime import datetime
         dt = datetime.fromtimestamp(commit.timestamp)
-        print(f"date   {dt.strftime('%a %b %d %H:%M:%S %Y %z')}")
+        lines.append(f"date   {dt.strftime('%a %b %d %H:%M:%S %Y %z')}\n")
     
-    print()
-    print(commit.message)
+    lines.append(f"\n{commit.message}\n")
+    sys.stdout.write(''.join(lines))
+
+# Object type by the first three digits of a tree entry mode
+_MODE_PREFIX_TYPE = {
+    '100': 'blob',
+    '400': 'tree',
+    '120': 'blob',    # symlink
+    '160': 'commit',  # gitlink
+}
 
 def _mode_to_type(mode: str) -> str:
     """Convert file mode to object type"""
-    if mode.startswith('100'):
-        return 'blob'
-    elif mode.startswith('400'):
-        return 'tree'
-    elif mode.startswith('120'):
-        return 'blob'  # symlink
-    elif mode.startswith('160'):
-        return 'commit'  # gitlink
-    else:
-        return 'unknown'
+    return _MODE_PREFIX_TYPE.get(mode[:3], 'unknown')
+
+# Printable ASCII maps to itself, every other byte to '.'
+_HEX_DUMP_ASCII = bytes(b if 32 <= b <= 126 else 0x2e for b in range(256))
 
 def _print_hex_dump(data: bytes, bytes_per_line: int = 16):
     """Print hex dump for binary data"""
+    lines = []
     for i in range(0, len(data), bytes_per_line):
         chunk = data[i:i + bytes_per_line]
-        hex_str = ' '.join(f'{b:02x}' for b in chunk)
-        ascii_str = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-        print(f"{i:08x}: {hex_str:<48} {ascii_str}")
+        hex_digits = chunk.hex()
+        hex_str = ' '.join(hex_digits[j:j + 2] for j in range(0, len(hex_digits), 2))
+        ascii_str = chunk.translate(_HEX_DUMP_ASCII).decode('ascii')
+        lines.append(f"{i:08x}: {hex_str:<48} {ascii_str}\n")
+    sys.stdout.write(''.join(lines))
 
-def _stream_object_data(data: bytes, chunk_size: int = 8192):
-    """Stream large object data in chunks"""
-    for i in range(0, len(data), chunk_size):
-        sys.stdout.buffer.write(data[i:i + chunk_size])
-        sys.stdout.buffer.flush()
+# Bytes gathered into one os.writev() call when streaming to a real fd
+WRITEV_BATCH_SIZE = 1 << 20  # 1 MiB
+
+def _stream_object_data(chunks: Iterable[bytes]):
+    """Stream object data to stdout, batching chunks into vectored writes"""
+    sys.stdout.flush()
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        # Text-only stdout (a StringIO in tests or embedding callers)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        for chunk in chunks:
+            sys.stdout.write(decoder.decode(chunk))
+        sys.stdout.write(decoder.decode(b'', final=True))
+        return
+    out.flush()
+    
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if fd is None or not hasattr(os, 'writev'):
+        for chunk in chunks:
+            out.write(chunk)
+        out.flush()
+        return
+    
+    batch = []
+    batch_size = 0
+    for chunk in chunks:
+        batch.append(chunk)
+        batch_size += len(chunk)
+        if batch_size >= WRITEV_BATCH_SIZE:
+            _writev_all(fd, batch)
+            batch = []
+            batch_size = 0
+    if batch:
+        _writev_all(fd, batch)
+
+def _writev_all(fd: int, buffers: list):
+    """os.writev() the buffers, resuming after short writes"""
+    while buffers:
+        written = os.writev(fd, buffers)
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers.pop(0))
+        if written:
+            buffers[0] = memoryview(buffers[0])[written:]
+
+def _open_blob_body(repo: Repository, obj_hash: str) -> Optional[Iterator[bytes]]:
+    """Iterate over a blob's content chunks, or None if it is not a blob"""
+    chunks = ObjectFactory.open_object_stream(repo, obj_hash)
+    head = b''
+    for chunk in chunks:
+        head += chunk
+        if b'\0' in head:
+            break
+    
+    header, _, body = head.partition(b'\0')
+    if not header.startswith(b'blob '):
+        return None
+    return itertools.chain((body,), chunks)
+
+# Text blobs up to this size are held in memory while they are checked
+TEXT_BLOB_SPOOL_SIZE = 1 << 20  # 1 MiB
+
+def _stream_text_blob(repo: Repository, obj_hash: str) -> bool:
+    """
+    Stream the content of a text blob to stdout without loading it whole.
+    
+    The blob is inflated once. All of it must decode as UTF-8 before any
+    of it is written, so the content is spooled meanwhile; blobs larger
+    than TEXT_BLOB_SPOOL_SIZE spill to a temporary file. Returns False,
+    having written nothing, when the object is not a blob or is not valid
+    UTF-8, so the caller can fall back to the regular pretty printer.
+    """
+    body = _open_blob_body(repo, obj_hash)
+    if body is None:
+        return False
+    
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with tempfile.SpooledTemporaryFile(max_size=TEXT_BLOB_SPOOL_SIZE) as spool:
+        try:
+            for chunk in body:
+                decoder.decode(chunk)
+                spool.write(chunk)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return False
+        
+        spool.seek(0)
+        _stream_object_data(iter(lambda: spool.read(WRITEV_BATCH_SIZE), b''))
+    return True
+
+# Objects read ahead of the one being written in batch mode
+BATCH_PIPELINE_DEPTH = 64
+
+def _pipeline_batch(lines: Iterable[str], read,
+                    memoize: bool = False) -> Iterator[Tuple[str, Future]]:
+    """
+    Yield (obj_hash, future) for each non-empty input line, in input order.
+    
+    A producer thread consumes the lines and submits read(obj_hash) to a
+    thread pool, so object files are read and inflated while earlier
+    results are still being written. At most BATCH_PIPELINE_DEPTH lines
+    are in flight; each item is yielded as soon as its line is read, so
+    interactive callers still get one answer per line. With memoize, a
+    repeated hash reuses the first future; only use it for small results.
+    """
+    pending = queue.Queue(maxsize=BATCH_PIPELINE_DEPTH)
+    workers = min(BATCH_PIPELINE_DEPTH, os.cpu_count() or 1)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    producer_error = []
+    futures: Dict[str, Future] = {}
+    
+    def produce():
+        try:
+            for line in lines:
+                obj_hash = line.strip()
+                if not obj_hash:
+                    continue
+                future = futures.get(obj_hash)
+                if future is None:
+                    future = executor.submit(read, obj_hash)
+                    if memoize:
+                        futures[obj_hash] = future
+                pending.put((obj_hash, future))
+        except BaseException as e:
+            producer_error.append(e)
+        finally:
+            pending.put(None)
+    
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            yield item
+    finally:
+        # Drop reads queued behind an abandoned consumer; shutdown()'s
+        # cancel_futures needs Python 3.9
+        while True:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].cancel()
+        executor.shutdown(wait=False)
+    
+    if producer_error:
+        raise producer_error[0]
 
 def _batch_process_objects(repo: Repository, args) -> bool:
     """Process multiple objects in batch mode"""
     try:
         if args.batch_check:
             # Format: <sha> <type> <size>
-            for line in sys.stdin:
-                obj_hash = line.strip()
-                if not obj_hash:
-                    continue
+            # Only the header is inflated; the body is never read
+            read = lambda obj_hash: ObjectFactory.read_header(repo, obj_hash)
+            for obj_hash, future in _pipeline_batch(sys.stdin, read, memoize=True):
                 try:
-                    obj = ObjectFactory.read_object(repo, obj_hash)
-                    obj_type = _get_object_type(obj)
-                    size = _get_object_size(obj)
+                    obj_type, size = future.result()
                     print(f"{obj_hash} {obj_type} {size}")
                 except Exception:
                     print(f"{obj_hash} missing")
         else:
-            # Full batch mode
-            for line in sys.stdin:
-                obj_hash = line.strip()
-                if not obj_hash:
-                    continue
+            # Full batch mode; repeated objects come from the factory's
+            # bounded ObjectCache rather than an unbounded memo here
+            factory = ObjectFactory.get_instance()
+            read = lambda obj_hash: factory.read_object(repo, obj_hash)
+            for obj_hash, future in _pipeline_batch(sys.stdin, read):
                 try:
-                    obj = ObjectFactory.read_object(repo, obj_hash)
+                    obj = future.result()
                     if args.pretty_print:
                         _pretty_print_object(obj, obj_hash, args)
                     else:
@@ -281,29 +444,37 @@ def setup_parser(parser):
         help="Stream large objects instead of loading into memory"
     )
 
+# prefix directory -> (mtime_ns, sorted object file names)
+_short_sha_index: Dict[Path, Tuple[int, List[str]]] = {}
+
 def _handle_short_sha(repo: Repository, short_sha: str) -> Optional[str]:
-    """Resolve short SHA to full SHA (basic implementation)"""
-    # This is a simplified version - real Git has more sophisticated matching
-    objects_dir = repo.gitdir / "objects"
-    if not objects_dir.exists():
-        return None
-    
-    prefix = short_sha[:2]
+    """Resolve short SHA to full SHA, raising ValueError if it is ambiguous"""
+    prefix_dir = repo.gitdir / "objects" / short_sha[:2]
     suffix = short_sha[2:]
-    prefix_dir = objects_dir / prefix
     
-    if prefix_dir.exists():
-        for obj_file in prefix_dir.iterdir():
-            if obj_file.name.startswith(suffix):
-                return prefix + obj_file.name
+    # The sorted listing is reused until the directory changes
+    try:
+        mtime_ns = prefix_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _short_sha_index.get(prefix_dir)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, sorted(os.listdir(prefix_dir)))
+        _short_sha_index[prefix_dir] = cached
+    names = cached[1]
     
-    return None
+    i = bisect.bisect_left(names, suffix)
+    if i == len(names) or not names[i].startswith(suffix):
+        return None
+    if i + 1 < len(names) and names[i + 1].startswith(suffix):
+        raise ValueError(f"short SHA {short_sha} is ambiguous")
+    return short_sha[:2] + names[i]
 
 # Advanced feature: Object inspection and validation
 def _validate_object_integrity(repo: Repository, obj_hash: str) -> bool:
     """Validate that object content matches its hash"""
     try:
-        obj = ObjectFactory.read_object(repo, obj_hash)
+        obj = ObjectFactory.get_instance().read_object(repo, obj_hash)
         calculated_hash = obj.get_hash()
         return calculated_hash == obj_hash
     except Exception:
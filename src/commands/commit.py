@@ -1,11 +1,46 @@
 import argparse
+import json
+import os
 import time
+import traceback
 from pathlib import Path
-from ..repository import Repository
+from typing import Any, Dict
+from ..repository import Repository, RepositoryError
 from ..objects.commit import Commit
 from ..objects.tree import Tree
-from ..objects.blob import Blob
 from ..objects.factory import ObjectFactory
+from ..objects.base import store_blobs
+
+# Working tree stat data -> blob SHA, plus the tree those blobs formed,
+# kept between commits
+BLOB_CACHE_FILE = "blob-cache.json"
+BLOB_CACHE_RACY_NS = 2_000_000_000  # Covers 1-2s mtime filesystems
+
+def _load_blob_cache(repo: Repository) -> Dict[str, Any]:
+    """
+    Load the blob cache, empty if missing or unusable.
+    
+    Format: {'tree': sha, 'files': {name: [mtime_ns, size, sha]}}
+    """
+    try:
+        with open(repo.gitdir / BLOB_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or not isinstance(cache.get('files'), dict):
+        return {}
+    return cache
+
+def _save_blob_cache(repo: Repository, cache: Dict[str, Any]):
+    """Atomically replace the blob cache; failures only cost a rehash"""
+    cache_path = repo.gitdir / BLOB_CACHE_FILE
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 def cmd_commit(args):
     """Record changes to the repository"""
@@ -21,15 +56,57 @@ def cmd_commit(args):
         # Create a tree from staged files (simplified)
         tree = Tree()
         
-        # Look for any files in the working directory
-        for file_path in Path('.').iterdir():
-            if file_path.is_file() and file_path.name != '.mygit':
-                blob = Blob.from_file(str(file_path))
-                blob_sha = factory.write_object(repo, blob)
-                tree.add_file_entry(file_path.name, blob_sha)
+        objects_dir = repo.gitdir / "objects"
+        objects_dir.mkdir(parents=True, exist_ok=True)
+        cache = _load_blob_cache(repo)
+        blob_cache = cache.get('files', {})
+        new_cache = {}
+        started_ns = time.time_ns()
         
-        # Write the tree
-        tree_sha = factory.write_object(repo, tree)
+        # Look for any files in the working directory; files whose stat
+        # matches the cache reuse the blob written by an earlier commit
+        changed = []
+        with os.scandir('.') as it:
+            for entry in it:
+                if not entry.is_file() or entry.name == '.mygit':
+                    continue
+                
+                st = entry.stat()
+                stamp = [st.st_mtime_ns, st.st_size]
+                cached = blob_cache.get(entry.name)
+                if cached and cached[:2] == stamp:
+                    blob_sha = cached[2]
+                    if (objects_dir / blob_sha[:2] / blob_sha[2:]).exists():
+                        tree.add_file_entry(entry.name, blob_sha)
+                        new_cache[entry.name] = cached
+                        continue
+                changed.append((Path(entry.name), stamp))
+        
+        # Blobs are hashed and compressed on a thread pool; entries are
+        # added afterwards so the tree does not depend on completion order
+        paths = [path for path, _ in changed]
+        for (path, stamp), blob_sha in zip(changed, store_blobs(paths, objects_dir)):
+            tree.add_file_entry(path.name, blob_sha)
+            # A file modified within the clock granularity of this commit
+            # could change again without its mtime moving; leave it uncached
+            if stamp[0] < started_ns - BLOB_CACHE_RACY_NS:
+                new_cache[path.name] = stamp + [blob_sha]
+        
+        # Nothing added, removed or modified since the cache was written:
+        # the tree is the one recorded with it, so skip re-serializing it
+        tree_sha = cache.get('tree')
+        if (changed or len(new_cache) != len(blob_cache) or not tree_sha
+                or not (objects_dir / tree_sha[:2] / tree_sha[2:]).exists()):
+            tree_sha = factory.write_object(repo, tree)
+        
+        # Racy files are never cached, so a tree built with one is not
+        # reusable and is not recorded
+        new_state = {
+            'tree': tree_sha if len(new_cache) == len(tree.entries) else None,
+            'files': new_cache,
+        }
+        if new_state != cache:
+            _save_blob_cache(repo, new_state)
         
         # Create commit
         commit = Commit()
@@ -39,9 +116,24 @@ def cmd_commit(args):
         commit.message = args.message
         commit.timestamp = int(time.time())
         
+        # The commit continues whatever HEAD points at; an unborn branch
+        # gets a root commit
+        try:
+            parent_sha = repo.get_HEAD()
+        except RepositoryError:
+            parent_sha = None
+        if parent_sha:
+            commit.add_parent(parent_sha)
+        
         # Write commit
         commit_sha = factory.write_object(repo, commit)
         
+        # Advance the current branch, or HEAD itself when detached
+        branch = repo.get_current_branch()
+        ref_path = repo.gitdir / "refs" / "heads" / branch if branch else repo.gitdir / "HEAD"
+        ref_path.parent.mkdir(parents=True, exist_ok=True)
+        ref_path.write_text(commit_sha + '\n')
+        
         print(f"Created commit: {commit_sha}")
         print(f"Tree: {tree_sha}")
         print(f"Message: {args.message}")
@@ -51,7 +143,6 @@ def cmd_commit(args):
         
     except Exception as e:
         print(f"Error creating commit: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
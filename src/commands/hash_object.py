@@ -1,114 +1,81 @@
 import argparse
+import hashlib
 import sys
 import os
-import zlib
 
 from pathlib import Path
-from typing import List, Optional, Iterator
+from typing import List, Optional, Iterator, Set
+from ..objects.base import GitObject, LooseObjectFile, map_file, store_blob, zlib
 from ..objects.factory import ObjectFactory
 from ..repository import Repository
-from ..objects.blob import Blob
 from ..objects.tree import Tree
 from ..objects.commit import Commit
-from typing import Dict
 
 class ObjectHasher:
     """Handles efficient object hashing and creation"""
     
     def __init__(self, repo: Optional[Repository] = None):
         self.repo = repo
-        self.cache: Dict[str, str] = {}  # content_hash -> object_sha
+        self.cache: Set[str] = set()  # SHAs already written by this hasher
     
     def hash_data(self, data: bytes, obj_type: str = "blob", create: bool = False) -> str:
         """Hash data and optionally create object"""
-        obj = ObjectFactory.create_object(obj_type, data)
-        sha = obj.get_hash()
+        # Like git, hash the data exactly as given; parsing it through the
+        # factory only rejects malformed trees and commits
+        serialized = b"%s %d\0" % (obj_type.encode(), len(data)) + data
+        ObjectFactory.get_instance().create_object(obj_type, serialized)
+        sha = hashlib.sha1(serialized).hexdigest()
         
-        # Check cache first
-        content_hash = self._get_content_hash(data)
-        if content_hash in self.cache:
-            return self.cache[content_hash]
-        
-        # Create object if requested
-        if create and self.repo:
-            self._store_object(obj, sha)
-            self.cache[content_hash] = sha
+        # The SHA already identifies the content, so it doubles as the
+        # cache key; no second pass over the data is needed
+        if create and self.repo and sha not in self.cache:
+            self._store_object(serialized, sha)
+            self.cache.add(sha)
         
         return sha
     
-    def hash_file(self, file_path: Path, obj_type: str = "blob", create: bool = False, 
-                  stream: bool = False) -> str:
+    def hash_file(self, file_path: Path, obj_type: str = "blob", create: bool = False) -> str:
         """Hash a file and optionally create object"""
-        if stream and obj_type == "blob" and file_path.stat().st_size > 1024 * 1024:  # 1MB
-            return self._hash_large_file(file_path, create)
-        else:
-            data = file_path.read_bytes()
-            return self.hash_data(data, obj_type, create)
-    
-    def _hash_large_file(self, file_path: Path, create: bool) -> str:
-        """Hash large files using streaming to avoid memory issues"""
-        # For large files, we need to read, hash, and potentially write in chunks
-        blob = Blob()
-        
-        if create and self.repo:
-            # Stream directly to object storage
-            return self._stream_file_to_object(file_path)
-        else:
-            # Just calculate hash without storing
+        if obj_type == "blob":
+            # Blobs skip the Blob/ObjectFactory round trip whatever their
+            # size: small files are read once, large ones are mapped, and
+            # only objects not yet stored are compressed
+            if create and self.repo:
+                return self._stream_file_to_object(file_path)
             return self._calculate_file_hash(file_path)
+        
+        data = file_path.read_bytes()
+        return self.hash_data(data, obj_type, create)
     
     def _stream_file_to_object(self, file_path: Path) -> str:
         """Stream file directly to object storage while hashing"""
-        import hashlib
-        import zlib
-        
-        # Read file and build object in memory for now
-        # In a more advanced implementation, this would stream to temp files
-        data = file_path.read_bytes()
-        
-        blob = Blob(data)
-        sha = blob.get_hash()
-        self._store_object(blob, sha)
-        
-        return sha
+        objects_dir = self.repo.gitdir / "objects"
+        objects_dir.mkdir(parents=True, exist_ok=True)
+        return store_blob(file_path, objects_dir)
     
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate hash of file without loading entire content into memory"""
-        import hashlib
-        
-        sha1 = hashlib.sha1()
-        file_size = 0
-        
-        with open(file_path, 'rb') as f:
-            while True:
-                chunk = f.read(8192)
-                if not chunk:
-                    break
-                sha1.update(chunk)
-                file_size += len(chunk)
-        
-        # Create header and final hash
-        header = f"blob {file_size}\0".encode()
-        sha1_header = hashlib.sha1(header)
-        sha1_header.update(sha1.digest())
+        # The mapping is handed to SHA-1 in one call; pages are faulted in
+        # on demand instead of being copied into a bytes object
+        with open(file_path, 'rb') as f, map_file(f) as mm:
+            sha1 = hashlib.sha1(b"blob %d\0" % len(mm))
+            sha1.update(mm)
         
-        return sha1_header.hexdigest()
+        return sha1.hexdigest()
     
-    def _store_object(self, obj, sha: str):
-        """Store object in repository"""
+    def _store_object(self, serialized: bytes, sha: str):
+        """Store a serialized object in repository"""
         if not self.repo:
             return
         
+        # Content-addressed: an existing object already holds these bytes
         obj_path = self.repo.gitdir / "objects" / sha[:2] / sha[2:]
-        obj_path.parent.mkdir(parents=True, exist_ok=True)
+        if obj_path.exists():
+            return
         
-        with open(obj_path, 'wb') as f:
-            f.write(obj.compress())
-    
-    def _get_content_hash(self, data: bytes) -> str:
-        """Get a quick hash of content for caching"""
-        import hashlib
-        return hashlib.md5(data).hexdigest()  # md5 is fine for cache
+        with LooseObjectFile(obj_path.parent.parent) as f:
+            f.write(zlib.compress(serialized, GitObject.COMPRESSION_LEVEL))
+            f.publish(obj_path)
 
 class BatchProcessor:
     """Process multiple files in batch mode"""
@@ -117,7 +84,7 @@ class BatchProcessor:
         self.hasher = hasher
     
     def process_files(self, files: List[Path], obj_type: str, create: bool, 
-                     stream: bool, verbose: bool) -> bool:
+                     verbose: bool) -> bool:
         """Process multiple files"""
         success = True
         
@@ -128,7 +95,7 @@ class BatchProcessor:
                 continue
             
             try:
-                sha = self.hasher.hash_file(file_path, obj_type, create, stream)
+                sha = self.hasher.hash_file(file_path, obj_type, create)
                 
                 if verbose:
                     size = file_path.stat().st_size
@@ -158,7 +125,7 @@ class BatchProcessor:
                 continue
             
             try:
-                sha = self.hasher.hash_file(file_path, obj_type, create, False)
+                sha = self.hasher.hash_file(file_path, obj_type, create)
                 print(f"{sha} {file_path}")
             except Exception as e:
                 print(f"Error processing {file_path}: {e}")
@@ -169,32 +136,26 @@ class BatchProcessor:
 def cmd_hash_object(args):
     """Compute object ID and optionally create object"""
     from pathlib import Path
-    from ..objects.blob import Blob
     
     try:
         path = Path(args.file)
         if not path.exists():
             print(f"Error: File '{args.file}' not found")
             return False
-            
-        # Create blob from file
-        blob = Blob.from_file(str(path))
-        sha = blob.get_hash()
         
         if args.verbose:
             print(f"File: {args.file}")
-            print(f"Size: {blob.get_size()} bytes")
+            print(f"Size: {path.stat().st_size} bytes")
             print(f"Type: {args.type}")
         
-        # Write to object database if requested
+        # The file is hashed (and written) from a mapping or one read rather
+        # than loaded into a Blob, so large files stay out of memory
         if args.write:
             from ..repository import find_repository
-            from ..objects.factory import ObjectFactory
             
             repo = find_repository()
             if repo:
-                factory = ObjectFactory.get_instance()
-                written_sha = factory.write_object(repo, blob)
+                written_sha = ObjectHasher(repo).hash_file(path, create=True)
                 if args.verbose:
                     print(f"Written to object database: {written_sha}")
                 else:
@@ -204,7 +165,7 @@ def cmd_hash_object(args):
                 return False
         else:
             # Just print the hash
-            print(sha)
+            print(ObjectHasher().hash_file(path))
             
         return True
         
@@ -276,9 +237,6 @@ Examples:
 
   # Verbose output with file sizes
   mygit hash-object -v *.py
-
-  # Stream large files
-  mygit hash-object --stream -w large_file.iso
 """
     print(examples)
 
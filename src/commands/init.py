@@ -67,7 +67,9 @@ ENV/
         
         for filename, content in template["files"].items():
             file_path = repo_path / filename
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # repo_path itself already exists; only nested files need a mkdir
+            if file_path.parent != repo_path:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(content)
             if verbose:
                 print(f"  Created {filename}")
@@ -82,55 +84,10 @@ class SharedRepositoryManager:
             return
         
         # Set up group permissions and configuration
-        config_file = repo.gitdir / "config"
+        repo.config.set('core', 'sharedRepository', args.shared)
         
-        # Read existing config or create new
-        config_content = []
-        if config_file.exists():
-            config_content = config_file.read_text().splitlines()
-        
-        # Add or update shared configuration
-        core_section = False
-        updated = False
-        
-        new_config = []
-        for line in config_content:
-            if line.strip() == '[core]':
-                core_section = True
-                new_config.append(line)
-            elif core_section and line.strip().startswith('sharedRepository'):
-                # Update existing setting
-                new_config.append(f'\tsharedRepository = {args.shared}')
-                updated = True
-            elif core_section and line.strip().startswith('[') and line.strip() != '[core]':
-                # Insert before next section
-                if not updated:
-                    new_config.append(f'\tsharedRepository = {args.shared}')
-                    updated = True
-                new_config.append(line)
-            else:
-                new_config.append(line)
-        
-        # Add if not found
-        if not updated:
-            if '[core]' not in new_config:
-                new_config.append('[core]')
-            new_config.append(f'\tsharedRepository = {args.shared}')
-        
-        config_file.write_text('\n'.join(new_config))
-        
-        # Set directory permissions (Unix-like systems)
-        if hasattr(os, 'chmod'):
-            try:
-                # Set group writable and setgid bit
-                os.chmod(repo.gitdir, 0o2775)
-                for root, dirs, files in os.walk(repo.gitdir):
-                    for d in dirs:
-                        os.chmod(Path(root) / d, 0o2775)
-                    for f in files:
-                        os.chmod(Path(root) / f, 0o664)
-            except OSError:
-                pass  # Permission changes might fail on some systems
+        # Set group writable and setgid bit (Unix-like systems)
+        repo.set_shared_permissions()
 
 class BranchConfigurator:
     """Handles initial branch configuration"""
@@ -158,15 +115,16 @@ class RepositoryValidator:
         if path.exists():
             if path.is_file():
                 return False, f"Path {path} is a file, not a directory"
-            if any(path.iterdir()) and not bare:
-                return False, f"Directory {path} is not empty"
+            if not bare:
+                # Stops at the first entry and closes the directory handle
+                with os.scandir(path) as it:
+                    if next(it, None) is not None:
+                        return False, f"Directory {path} is not empty"
         
-        # Check if we can create the directory
+        # Writability is not probed with a test file: repo.create() is the
+        # first write and reports an unwritable path itself
         try:
             path.mkdir(parents=True, exist_ok=True)
-            test_file = path / ".mygit_test"
-            test_file.touch()
-            test_file.unlink()
             return True, ""
         except (OSError, PermissionError) as e:
             return False, f"Cannot create repository: {e}"
@@ -223,21 +181,23 @@ def _initialize_repository(repo: Repository, args) -> bool:
                 args.verbose
             )
         
-        # Configure shared repository settings
-        if args.shared:
+        # Config changes below are parsed once and written once
+        with repo.config.batch():
+            # Configure shared repository settings
+            if args.shared:
+                if args.verbose:
+                    print("Configuring shared repository settings")
+                SharedRepositoryManager.configure_shared_repository(repo, args)
+            
+            # Configure initial branch
+            initial_branch = args.initial_branch
             if args.verbose:
-                print("Configuring shared repository settings")
-            SharedRepositoryManager.configure_shared_repository(repo, args)
-        
-        # Configure initial branch
-        initial_branch = args.initial_branch
-        if args.verbose:
-            print(f"Setting initial branch to: {initial_branch}")
-        BranchConfigurator.configure_initial_branch(repo, initial_branch, args.verbose)
-        
-        # Create custom directory structure
-        if args.objects_dir or args.refs_dir:
-            _create_custom_structure(repo, args)
+                print(f"Setting initial branch to: {initial_branch}")
+            BranchConfigurator.configure_initial_branch(repo, initial_branch, args.verbose)
+            
+            # Create custom directory structure
+            if args.objects_dir or args.refs_dir:
+                _create_custom_structure(repo, args)
         
         # Create initial commit if requested
         if args.initial_commit:
@@ -269,43 +229,26 @@ def _create_custom_structure(repo: Repository, args):
 
 def _update_config(repo: Repository, key: str, value: str):
     """Update repository configuration"""
-    config_file = repo.gitdir / "config"
-    
-    if config_file.exists():
-        content = config_file.read_text()
-    else:
-        content = ""
-    
-    # Simple config update - could be enhanced with proper config parser
     section, setting = key.split('.', 1)
+    repo.config.set(section, setting, value)
+
+def _walk_worktree(root: Path):
+    """
+    Yield the files under root, skipping dot-entries such as .mygit.
     
-    if f"[{section}]" not in content:
-        content += f"\n[{section}]\n\t{setting} = {value}\n"
-    else:
-        # Update existing setting (simplified)
-        lines = content.splitlines()
-        new_lines = []
-        in_section = False
-        
-        for line in lines:
-            if line.strip() == f"[{section}]":
-                in_section = True
-                new_lines.append(line)
-            elif in_section and line.strip().startswith('['):
-                in_section = False
-                new_lines.append(f"\t{setting} = {value}")
-                new_lines.append(line)
-            elif in_section and line.strip().startswith(setting):
-                new_lines.append(f"\t{setting} = {value}")
-            else:
-                new_lines.append(line)
-        
-        if in_section and not any(line.strip().startswith(setting) for line in new_lines):
-            new_lines.append(f"\t{setting} = {value}")
-        
-        content = '\n'.join(new_lines)
-    
-    config_file.write_text(content)
+    DirEntry type checks use the cached dirent type, so unlike rglob
+    plus is_file() no entry needs a separate stat.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
 
 def _create_initial_commit(repo: Repository, args):
     """Create an initial commit if there are files to commit"""
@@ -313,39 +256,34 @@ def _create_initial_commit(repo: Repository, args):
         from ..objects.factory import ObjectFactory
         from ..objects.commit import Commit
         from ..objects.tree import Tree
+        from ..objects.base import store_blobs
         import time
         
         # Check if there are any files to commit
         worktree = repo.worktree if not args.bare else repo.gitdir
-        files = list(worktree.rglob('*'))
-        files = [f for f in files if f.is_file() and f.name != '.mygit' and not f.name.startswith('.')]
+        files = list(_walk_worktree(worktree))
         
         if not files:
             if args.verbose:
                 print("  No files found for initial commit")
             return
         
+        # Objects go through write_object, which skips ones already stored
+        # and publishes the rest atomically
+        factory = ObjectFactory.get_instance()
+        
+        # Blobs are streamed and compressed on a thread pool; entries
+        # are added afterwards in file order
+        objects_dir = repo.gitdir / "objects"
+        blob_shas = store_blobs(files, objects_dir)
+        
         # Create a tree from the files (simplified)
         tree = Tree()
-        for file_path in files:
-            if file_path.is_file() and file_path.name != '.mygit':
-                # Create blob (simplified - would need proper implementation)
-                blob = ObjectFactory.create_object('blob')
-                blob.data = file_path.read_bytes()
-                blob_sha = blob.get_hash()
-                
-                # Store blob
-                obj_path = repo.gitdir / "objects" / blob_sha[:2] / blob_sha[2:]
-                obj_path.parent.mkdir(parents=True, exist_ok=True)
-                obj_path.write_bytes(blob.compress())
-                
-                tree.add_entry('100644', file_path.name, blob_sha)
+        for file_path, blob_sha in zip(files, blob_shas):
+            tree.add_entry('100644', file_path.name, blob_sha)
         
         # Store tree
-        tree_sha = tree.get_hash()
-        obj_path = repo.gitdir / "objects" / tree_sha[:2] / tree_sha[2:]
-        obj_path.parent.mkdir(parents=True, exist_ok=True)
-        obj_path.write_bytes(tree.compress())
+        tree_sha = factory.write_object(repo, tree)
         
         # Create commit
         commit = Commit()
@@ -355,10 +293,7 @@ def _create_initial_commit(repo: Repository, args):
         commit.message = args.initial_commit_message
         commit.timestamp = int(time.time())
         
-        commit_sha = commit.get_hash()
-        obj_path = repo.gitdir / "objects" / commit_sha[:2] / commit_sha[2:]
-        obj_path.parent.mkdir(parents=True, exist_ok=True)
-        obj_path.write_bytes(commit.compress())
+        commit_sha = factory.write_object(repo, commit)
         
         # Update branch reference
         branch_ref = repo.gitdir / "refs" / "heads" / args.initial_branch
@@ -1,9 +1,75 @@
 import argparse
+import sys
+import time
 from pathlib import Path
-from ..repository import Repository
+from ..repository import Repository, RepositoryError
 from ..objects.factory import ObjectFactory
 from ..objects.commit import Commit
-from datetime import datetime
+
+def _scan_commits(repo, factory):
+    """Find every commit in the object store, newest first"""
+    objects_dir = repo.gitdir / "objects"
+    commits = []
+    
+    if objects_dir.exists():
+        # Walk through all objects
+        for prefix_dir in objects_dir.iterdir():
+            if prefix_dir.is_dir() and len(prefix_dir.name) == 2:
+                for obj_file in prefix_dir.iterdir():
+                    if obj_file.is_file():
+                        obj_sha = prefix_dir.name + obj_file.name
+                        try:
+                            # Inflate only the header to rule out blobs
+                            # and trees before paying for a full read
+                            if ObjectFactory.read_header(repo, obj_sha)[0] != 'commit':
+                                continue
+                            obj = factory.read_object(repo, obj_sha)
+                            if isinstance(obj, Commit):
+                                commits.append((obj_sha, obj))
+                        except Exception:
+                            # Skip objects that can't be read as commits
+                            continue
+    
+    # Newest first; commits made within the same second list children
+    # before their parents, and the SHA settles any remaining tie
+    generations = _commit_generations(dict(commits))
+    commits.sort(key=lambda x: (x[1].timestamp, generations[x[0]], x[0]), reverse=True)
+    return commits
+
+def _commit_generations(commits):
+    """Map each commit SHA to its distance from the root, within commits"""
+    generations = {}
+    for sha in commits:
+        stack = [sha]
+        while stack:
+            top = stack[-1]
+            if top in generations:
+                stack.pop()
+                continue
+            parents = [p for p in commits[top].parents if p in commits]
+            pending = [p for p in parents if p not in generations]
+            if pending:
+                stack.extend(pending)
+                continue
+            generations[top] = 1 + max((generations[p] for p in parents), default=0)
+            stack.pop()
+    return generations
+
+def _walk_first_parents(repo, factory, sha):
+    """Follow first parents from sha; only reachable commits are read"""
+    commits = []
+    
+    while sha:
+        try:
+            commit = factory.read_object(repo, sha)
+        except FileNotFoundError:
+            break  # History is cut off here; show what was reached
+        if not isinstance(commit, Commit):
+            break
+        commits.append((sha, commit))
+        sha = commit.parents[0] if commit.parents else None
+    
+    return commits
 
 def cmd_log(args):
     """Show commit history"""
@@ -15,55 +81,45 @@ def cmd_log(args):
             print("Not a git repository")
             return False
         
-        # Look for commit objects in the object database
-        objects_dir = repo.gitdir / "objects"
-        commits = []
+        factory = ObjectFactory.get_instance()
         
-        if objects_dir.exists():
-            # Walk through all objects
-            for prefix_dir in objects_dir.iterdir():
-                if prefix_dir.is_dir() and len(prefix_dir.name) == 2:
-                    for obj_file in prefix_dir.iterdir():
-                        if obj_file.is_file():
-                            obj_sha = prefix_dir.name + obj_file.name
-                            try:
-                                # Try to read as commit
-                                obj = ObjectFactory.read_object(repo, obj_sha)
-                                if isinstance(obj, Commit):
-                                    commits.append((obj_sha, obj))
-                            except Exception:
-                                # Skip objects that can't be read as commits
-                                continue
+        head_sha = None
+        if not args.all:
+            try:
+                head_sha = repo.get_HEAD()
+            except RepositoryError:
+                pass  # No commit on the current branch yet
+        
+        # --all, or an unborn branch, falls back to scanning the store
+        if head_sha:
+            commits = _walk_first_parents(repo, factory, head_sha)
+        else:
+            commits = _scan_commits(repo, factory)
         
         if not commits:
             print("No commits yet")
             return True
         
-        # Sort commits by timestamp (newest first)
-        commits.sort(key=lambda x: x[1].timestamp, reverse=True)
-        
         print(f"Found {len(commits)} commit(s):")
         print("=" * 50)
         
-        # Display commits
+        # Display commits, one write per commit
+        write = sys.stdout.write
         for sha, commit in commits:
             if args.oneline:
                 # One-line format
                 short_sha = sha[:7]
-                first_line = commit.message.split('\n')[0] if commit.message else ""
-                print(f"{short_sha} {first_line}")
+                first_line = commit.message.partition('\n')[0] if commit.message else ""
+                write(f"{short_sha} {first_line}\n")
             else:
-                # Full format
-                print(f"commit {sha}")
-                print(f"Author: {commit.author}")
-                print(f"Date:   {_format_timestamp(commit.timestamp)}")
-                print("")
-                
-                # Print message with indentation
-                for line in commit.message.splitlines():
-                    print(f"    {line}")
-                
-                print("")  # Empty line between commits
+                # Full format, message indented, empty line between commits
+                message = ''.join(f"    {line}\n" for line in commit.message.splitlines())
+                write(f"commit {sha}\n"
+                      f"Author: {commit.author}\n"
+                      f"Date:   {_format_timestamp(commit.timestamp)}\n"
+                      f"\n"
+                      f"{message}"
+                      f"\n")
         
         return True
         
@@ -73,8 +129,9 @@ def cmd_log(args):
 
 def _format_timestamp(timestamp):
     """Format timestamp as readable date"""
-    dt = datetime.fromtimestamp(timestamp)
-    return dt.strftime("%a %b %d %H:%M:%S %Y %z")
+    # time.localtime carries the UTC offset, so %z is filled in, and it
+    # skips building a datetime for every commit
+    return time.strftime("%a %b %d %H:%M:%S %Y %z", time.localtime(timestamp))
 
 def setup_parser(parser):
     """Setup argument parser for log command"""
@@ -82,4 +139,9 @@ def setup_parser(parser):
         "--oneline",
         action="store_true",
         help="Print each commit on a single line"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Show every commit in the object store, not just those reachable from HEAD"
     )
\ No newline at end of file
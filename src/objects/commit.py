@@ -250,18 +250,14 @@ class Commit(GitObject):
         """Get the first line of the commit message (summary)"""
         if not self.message:
             return ""
-        return self.message.split('\n')[0]
+        return self.message.partition('\n')[0]
     
     def get_body(self) -> str:
         """Get the commit message body (excluding summary)"""
         if not self.message:
             return ""
         
-        lines = self.message.split('\n')
-        if len(lines) <= 1:
-            return ""
-        
-        return '\n'.join(lines[1:]).strip()
+        return self.message.partition('\n')[2].strip()
     
     def _validate_internal(self) -> bool:
         """Internal validation for commit-specific rules"""
@@ -303,7 +299,7 @@ class Commit(GitObject):
             'author_info': self.get_author_info(),
             'committer_info': self.get_committer_info(),
             'message_summary': self.get_summary(),
-            'message_line_count': len(self.message.split('\n')) if self.message else 0,
+            'message_line_count': self.message.count('\n') + 1 if self.message else 0,
             'has_gpgsig': bool(self.gpgsig),
             'gpgsig_valid': self.verify_signature() if self.gpgsig else None,
             'note_count': len(self.notes),
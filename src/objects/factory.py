@@ -1,9 +1,10 @@
+import hashlib
 import os
 import threading
-from typing import Type, Dict, Optional, Any, List
+from typing import Type, Dict, Optional, Any, List, Iterator, Tuple
 from pathlib import Path
 from functools import lru_cache
-from .base import GitObject, ObjectValidationError
+from .base import GitObject, ObjectValidationError, LooseObjectFile, zlib
 from .blob import Blob
 from .commit import Commit
 from .tree import Tree
@@ -260,37 +261,74 @@ class ObjectFactory:
             self._cache.invalidate(sha)
             raise e
     
+    @staticmethod
+    def open_object_stream(repo, sha: str,
+                           chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield the decompressed object, header included, in bounded chunks"""
+        path = repo.gitdir / "objects" / sha[:2] / sha[2:]
+        if not path.exists():
+            raise FileNotFoundError(f"Object {sha} not found")
+        
+        decompressor = zlib.decompressobj()
+        with open(path, 'rb') as f:
+            for compressed in iter(lambda: f.read(chunk_size), b''):
+                # Cap each output chunk so highly compressible objects
+                # cannot inflate into one huge buffer
+                while compressed:
+                    chunk = decompressor.decompress(compressed, chunk_size)
+                    if chunk:
+                        yield chunk
+                    compressed = decompressor.unconsumed_tail
+        
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+    
+    @staticmethod
+    def read_header(repo, sha: str) -> Tuple[str, int]:
+        """Return (type, size) of a loose object, inflating only its header"""
+        path = repo.gitdir / "objects" / sha[:2] / sha[2:]
+        if not path.exists():
+            raise FileNotFoundError(f"Object {sha} not found")
+        
+        decompressor = zlib.decompressobj()
+        head = b''
+        with open(path, 'rb') as f:
+            while b'\0' not in head:
+                compressed = decompressor.unconsumed_tail or f.read(64)
+                if not compressed or len(head) > 64:
+                    raise ObjectValidationError("Invalid object format: missing null terminator")
+                head += decompressor.decompress(compressed, 64)
+        
+        header = head[:head.index(b'\0')]
+        try:
+            obj_type_str, size_str = header.split(b' ', 1)
+            return obj_type_str.decode('ascii'), int(size_str)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ObjectValidationError(f"Invalid object header: {e}")
+    
     def write_object(self, repo, obj: GitObject, use_cache: bool = True) -> str:
         """Write object to repository and return SHA"""
-        sha = obj.get_hash()
+        # Serialize once and hash the buffer directly; get_hash() and
+        # compress() would each serialize the object again
+        serialized = obj.serialize()
+        sha = hashlib.sha1(serialized).hexdigest()
         
         # Check if object already exists
         obj_path = repo.gitdir / "objects" / sha[:2] / sha[2:]
         if obj_path.exists():
             return sha
         
-        # Create directory if needed
-        obj_path.parent.mkdir(parents=True, exist_ok=True)
+        # Published atomically; a failed write leaves no partial object
+        with LooseObjectFile(obj_path.parent.parent) as f:
+            f.write(zlib.compress(serialized, obj.COMPRESSION_LEVEL))
+            f.publish(obj_path)
         
-        # Write object
-        try:
-            with open(obj_path, 'wb') as f:
-                f.write(obj.compress())
-            
-            # Cache the object
-            if use_cache:
-                self._cache.set(sha, obj)
-            
-            return sha
-            
-        except Exception as e:
-            # Remove partially written file
-            if obj_path.exists():
-                try:
-                    obj_path.unlink()
-                except OSError:
-                    pass
-            raise e
+        # Cache the object
+        if use_cache:
+            self._cache.set(sha, obj)
+        
+        return sha
     
     def batch_read_objects(self, repo, sha_list: List[str], 
                           use_cache: bool = True) -> Dict[str, GitObject]:
@@ -8,6 +8,13 @@ from .blob import Blob
 from .commit import Commit
 import hashlib
 
+# Compiled once; checked for every entry added to or validated in a tree
+_SHA_PATTERN = re.compile(r'[a-f0-9]{40}')
+
+def _tree_sort_key(entry: 'TreeEntry') -> str:
+    """Git orders entries by name, comparing directories as if their name ended in '/'"""
+    return entry.name + '/' if entry.mode == TreeEntry.MODE_DIRECTORY else entry.name
+
 class TreeEntry:
     """Represents a single entry in a tree object with enhanced functionality"""
     
@@ -138,11 +145,14 @@ class Tree(GitObject):
     
     def serialize(self) -> bytes:
         """Format: tree {size}\0{entries}"""
-        # Sort entries by name as required by Git format
-        sorted_entries = sorted(self.entries, key=lambda x: x.name)
-        entries_data = b''.join(entry.serialize() for entry in sorted_entries)
-        header = f"tree {len(entries_data)}\0".encode()
-        return header + entries_data
+        # Pack every entry's fields into one flat list and join once, with
+        # a slot for the header so the payload is never copied again
+        parts = [b'']
+        for entry in sorted(self.entries, key=_tree_sort_key):
+            parts += (entry.mode.encode(), b' ', entry.name.encode(), b'\0',
+                      bytes.fromhex(entry.sha))
+        parts[0] = b"tree %d\0" % sum(map(len, parts))
+        return b''.join(parts)
     
     def deserialize(self, data: bytes):
         """Parse tree data with validation"""
@@ -201,7 +211,7 @@ class Tree(GitObject):
             raise ValueError(f"Invalid tree entry name: {name}")
         
         # Validate SHA format
-        if not re.match(r'^[a-f0-9]{40}$', sha):
+        if not _SHA_PATTERN.fullmatch(sha):
             raise ValueError(f"Invalid SHA format: {sha}")
         
         # Validate mode
@@ -377,7 +387,7 @@ class Tree(GitObject):
         
         # Validate all entries
         for entry in self.entries:
-            if not re.match(r'^[a-f0-9]{40}$', entry.sha):
+            if not _SHA_PATTERN.fullmatch(entry.sha):
                 return False
         
         return True
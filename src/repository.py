@@ -1,6 +1,7 @@
 import os
 import configparser
 import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from enum import Enum
@@ -27,21 +28,41 @@ class RepositoryError(Exception):
     """Repository-specific exceptions"""
     pass
 
+def _read_ref(path: Path) -> str:
+    """Read HEAD or a ref with a single open and read; refs are tiny"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096).decode().strip()
+    finally:
+        os.close(fd)
+
 class ConfigManager:
     """Manages repository configuration"""
     
     def __init__(self, repo_path: Path):
         self.config_path = repo_path / "config"
-        self._config = configparser.ConfigParser()
-        self._load_config()
+        self._parser: Optional[configparser.ConfigParser] = None
+        self._batching = False
+    
+    @property
+    def _config(self) -> configparser.ConfigParser:
+        """Parsed on first use; most commands never read the config"""
+        if self._parser is None:
+            self._parser = configparser.ConfigParser()
+            try:
+                self._load_config()
+            except RepositoryError:
+                self._parser = None  # Report the error again on next use
+                raise
+        return self._parser
     
     def _load_config(self):
         """Load configuration from file"""
-        if self.config_path.exists():
-            try:
-                self._config.read(self.config_path)
-            except configparser.Error as e:
-                raise RepositoryError(f"Failed to parse config file: {e}")
+        try:
+            # read() skips a missing file, so no separate exists() check
+            self._config.read(self.config_path)
+        except configparser.Error as e:
+            raise RepositoryError(f"Failed to parse config file: {e}")
     
     def save(self):
         """Save configuration to file"""
@@ -63,6 +84,21 @@ class ConfigManager:
         if not self._config.has_section(section):
             self._config.add_section(section)
         self._config.set(section, key, value)
+        if not self._batching:
+            self.save()
+    
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into one write of the config file"""
+        if self._batching:
+            yield self
+            return
+        
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
         self.save()
     
     def get_boolean(self, section: str, key: str, default: bool = False) -> bool:
@@ -152,18 +188,25 @@ class RepositoryValidator:
         if not objects_dir.exists():
             return stats
         
-        # Walk through object database
-        for entry in objects_dir.iterdir():
-            if entry.is_dir() and len(entry.name) == 2:
-                for obj_file in entry.iterdir():
-                    if obj_file.is_file() and len(obj_file.name) == 38:
+        from .objects.factory import ObjectFactory
+        factory = ObjectFactory.get_instance()
+        
+        # Walk through object database; DirEntry answers is_dir/is_file
+        # from the directory listing, and the name checks run first
+        with os.scandir(objects_dir) as prefixes:
+            for entry in prefixes:
+                if len(entry.name) != 2 or not entry.is_dir():
+                    continue
+                with os.scandir(entry.path) as objects:
+                    for obj_file in objects:
+                        if len(obj_file.name) != 38 or not obj_file.is_file():
+                            continue
                         stats['total_objects'] += 1
                         
                         # Verify object can be read and decompressed
                         try:
-                            from objects.factory import ObjectFactory
                             obj_sha = entry.name + obj_file.name
-                            obj = ObjectFactory.read_object(self.repo, obj_sha)
+                            obj = factory.read_object(self.repo, obj_sha)
                             
                             # Verify hash matches filename
                             if obj.get_hash() == obj_sha:
@@ -192,30 +235,24 @@ class RepositoryValidator:
         if not refs_dir.exists():
             return stats
         
-        # Check branches
-        heads_dir = refs_dir / "heads"
-        if heads_dir.exists():
-            for branch_file in heads_dir.iterdir():
-                if branch_file.is_file():
-                    stats['branches'] += 1
-                    if not self._validate_ref_content(branch_file):
-                        stats['invalid_refs'] += 1
-        
-        # Check tags
-        tags_dir = refs_dir / "tags"
-        if tags_dir.exists():
-            for tag_file in tags_dir.iterdir():
-                if tag_file.is_file():
-                    stats['tags'] += 1
-                    if not self._validate_ref_content(tag_file):
-                        stats['invalid_refs'] += 1
+        # Check branches and tags
+        for kind, subdir in (('branches', 'heads'), ('tags', 'tags')):
+            try:
+                with os.scandir(refs_dir / subdir) as it:
+                    for ref_entry in it:
+                        if ref_entry.is_file():
+                            stats[kind] += 1
+                            if not self._validate_ref_content(Path(ref_entry.path)):
+                                stats['invalid_refs'] += 1
+            except FileNotFoundError:
+                continue
         
         return stats
     
     def _validate_ref_content(self, ref_file: Path) -> bool:
         """Validate reference file content"""
         try:
-            content = ref_file.read_text().strip()
+            content = _read_ref(ref_file)
             # Should be a 40-character SHA-1 or start with "ref: "
             return (len(content) == 40 and all(c in '0123456789abcdef' for c in content.lower()) or
                     content.startswith('ref: '))
@@ -293,15 +330,16 @@ class Repository:
             # self._setup_default_config()
             
             # Set repository type and format
-            self.config.set('core', 'repositoryformatversion', RepositoryFormat.V1.value)
-            self.config.set('core', 'filemode', 'true')
-            self.config.set('core', 'bare', str(bare).lower())
-            self.config.set('core', 'sharedrepository', str(shared).lower())
-            self.config.set('extensions', 'objectformat', object_format.value)
+            with self.config.batch():
+                self.config.set('core', 'repositoryformatversion', RepositoryFormat.V1.value)
+                self.config.set('core', 'filemode', 'true')
+                self.config.set('core', 'bare', str(bare).lower())
+                self.config.set('core', 'sharedrepository', str(shared).lower())
+                self.config.set('extensions', 'objectformat', object_format.value)
             
             # Set permissions for shared repositories
             if shared:
-                self._setup_shared_permissions()
+                self.set_shared_permissions()
             
             return True
             
@@ -344,16 +382,25 @@ class Repository:
             if not os.name == 'nt':  # Make executable on Unix-like systems
                 hook_path.chmod(0o755)
     
-    def _setup_shared_permissions(self):
-        """Setup permissions for shared repositories"""
+    def set_shared_permissions(self):
+        """Make the repository group-writable, with setgid directories"""
         if os.name != 'nt':  # Unix-like systems
             try:
-                # Set setgid bit for directories
-                for root, dirs, files in os.walk(self.gitdir):
-                    for d in dirs:
-                        os.chmod(Path(root) / d, 0o2775)
-                    for f in files:
-                        os.chmod(Path(root) / f, 0o664)
+                os.chmod(self.gitdir, 0o2775)
+                if os.chmod in os.supports_dir_fd:
+                    # chmod relative to each directory's fd so the kernel
+                    # does not resolve the full path for every entry
+                    for _, dirs, files, dir_fd in os.fwalk(self.gitdir):
+                        for d in dirs:
+                            os.chmod(d, 0o2775, dir_fd=dir_fd)
+                        for f in files:
+                            os.chmod(f, 0o664, dir_fd=dir_fd)
+                else:
+                    for root, dirs, files in os.walk(self.gitdir):
+                        for d in dirs:
+                            os.chmod(os.path.join(root, d), 0o2775)
+                        for f in files:
+                            os.chmod(os.path.join(root, f), 0o664)
             except OSError:
                 pass  # Ignore permission errors
     
@@ -388,23 +435,24 @@ class Repository:
     def get_branches(self) -> Dict[str, str]:
         """Get all branches and their HEAD commits"""
         branches = {}
-        heads_dir = self.gitdir / "refs" / "heads"
         
-        if heads_dir.exists():
-            for branch_file in heads_dir.iterdir():
-                if branch_file.is_file():
-                    try:
-                        commit_sha = branch_file.read_text().strip()
-                        branches[branch_file.name] = commit_sha
-                    except Exception:
-                        continue
+        try:
+            with os.scandir(self.gitdir / "refs" / "heads") as it:
+                for entry in it:
+                    if entry.is_file():
+                        try:
+                            branches[entry.name] = _read_ref(entry.path)
+                        except Exception:
+                            continue
+        except FileNotFoundError:
+            pass
         
         return branches
     
     def get_current_branch(self) -> Optional[str]:
         """Get current branch name"""
         try:
-            head_content = (self.gitdir / "HEAD").read_text().strip()
+            head_content = _read_ref(self.gitdir / "HEAD")
             if head_content.startswith('ref: refs/heads/'):
                 return head_content[16:]  # Remove 'ref: refs/heads/'
             return None
@@ -413,19 +461,22 @@ class Repository:
     
     def set_current_branch(self, branch_name: str):
         """Set current branch"""
-        head_file = self.gitdir / "HEAD"
-        head_file.write_text(f"ref: refs/heads/{branch_name}\n")
+        fd = os.open(self.gitdir / "HEAD", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, f"ref: refs/heads/{branch_name}\n".encode())
+        finally:
+            os.close(fd)
     
     def get_HEAD(self) -> str:
         """Get current HEAD commit SHA"""
         try:
-            head_content = (self.gitdir / "HEAD").read_text().strip()
+            head_content = _read_ref(self.gitdir / "HEAD")
             if head_content.startswith('ref: '):
                 # Follow symbolic reference
                 ref_path = self.gitdir / head_content[5:]
-                if ref_path.exists():
-                    return ref_path.read_text().strip()
-                else:
+                try:
+                    return _read_ref(ref_path)
+                except FileNotFoundError:
                     raise RepositoryError(f"Reference not found: {head_content[5:]}")
             else:
                 # Detached HEAD
@@ -458,7 +509,7 @@ class Repository:
     def is_detached_head(self) -> bool:
         """Check if HEAD is detached"""
         try:
-            head_content = (self.gitdir / "HEAD").read_text().strip()
+            head_content = _read_ref(self.gitdir / "HEAD")
             return not head_content.startswith('ref: ')
         except Exception:
             return False
@@ -8,7 +8,10 @@ from typing import List, Iterator, Optional, Dict, Any, Set, Union
 from enum import Enum
 import stat
 import shutil
+import fnmatch
+import re
 from contextlib import contextmanager
+from functools import lru_cache
 
 # Platform-specific imports - KEEP THIS SECTION
 if os.name == 'nt':  # Windows
@@ -283,53 +286,58 @@ def list_files_recursive(directory: Path,
         ignore_patterns = ['*.pyc', '*.pyo', '*.so', '*.egg-info']
     
     files = []
+    is_ignored = _compile_ignore_patterns(tuple(ignore_patterns))
     
     try:
-        for item in directory.iterdir():
-            # Skip hidden files if not included
-            if not include_hidden and item.name.startswith('.'):
-                continue
-            
-            # Skip ignored directories
-            if item.name in ignore_dirs:
-                continue
-            
-            # Skip items matching ignore patterns
-            if any(_matches_pattern(item.name, pattern) for pattern in ignore_patterns):
-                continue
-            
-            if item.is_file():
-                files.append(item)
-            elif item.is_dir():
-                files.extend(list_files_recursive(
-                    item, ignore_dirs, ignore_patterns, follow_symlinks, include_hidden
-                ))
-            elif item.is_symlink() and follow_symlinks:
-                try:
-                    target = handle_symlink(item, follow=True)
-                    if target.is_file():
-                        files.append(item)  # Keep symlink path
-                    elif target.is_dir():
-                        files.extend(list_files_recursive(
-                            target, ignore_dirs, ignore_patterns, follow_symlinks, include_hidden
-                        ))
-                except (OSError, RuntimeError):
-                    # Skip broken symlinks
+        # DirEntry caches the file type from readdir, saving a stat per entry
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                
+                # Skip hidden files if not included
+                if not include_hidden and name.startswith('.'):
+                    continue
+                
+                # Skip ignored directories
+                if name in ignore_dirs:
                     continue
+                
+                # Skip items matching ignore patterns
+                if is_ignored(name):
+                    continue
+                
+                item = Path(entry.path)
+                if entry.is_file():
+                    files.append(item)
+                elif entry.is_dir():
+                    files.extend(list_files_recursive(
+                        item, ignore_dirs, ignore_patterns, follow_symlinks, include_hidden
+                    ))
+                elif entry.is_symlink() and follow_symlinks:
+                    try:
+                        target = handle_symlink(item, follow=True)
+                        if target.is_file():
+                            files.append(item)  # Keep symlink path
+                        elif target.is_dir():
+                            files.extend(list_files_recursive(
+                                target, ignore_dirs, ignore_patterns, follow_symlinks, include_hidden
+                            ))
+                    except (OSError, RuntimeError):
+                        # Skip broken symlinks
+                        continue
     except PermissionError:
         # Skip directories we can't access
         pass
     
     return files
 
-def _matches_pattern(filename: str, pattern: str) -> bool:
-    """Check if filename matches pattern (simple glob support)"""
-    if pattern.startswith('*'):
-        return filename.endswith(pattern[1:])
-    elif pattern.endswith('*'):
-        return filename.startswith(pattern[:-1])
-    else:
-        return filename == pattern
+@lru_cache(maxsize=32)
+def _compile_ignore_patterns(patterns: tuple):
+    """Compile glob patterns into a single regex match function"""
+    if not patterns:
+        return lambda filename: False
+    regex = '|'.join(fnmatch.translate(pattern) for pattern in patterns)
+    return re.compile(regex).match
 
 def find_git_root(start_path: Path = Path('.')) -> Optional[Path]:
     """Find the root of the git repository with cross-platform support"""
@@ -6,19 +6,27 @@ import stat
 from pathlib import Path
 from unittest.mock import patch, MagicMock, call
 import sys
+import hashlib
+import zlib
 from io import StringIO
+from types import SimpleNamespace
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.commands.init import cmd_init
-from src.commands.add import cmd_add
-from src.commands.commit import cmd_commit
+from src.commands.add import cmd_add, _expand_arguments
+from src.commands.commit import cmd_commit, _load_blob_cache
 from src.commands.log import cmd_log
-from src.commands.hash_object import cmd_hash_object
-from src.commands.cat_file import cmd_cat_file
+from src.commands.hash_object import cmd_hash_object, ObjectHasher
+from src.commands.cat_file import cmd_cat_file, TEXT_BLOB_SPOOL_SIZE, _handle_short_sha
+from src.cli import _sniff_subcommand, load_commands
+from src.commands import COMMANDS
 from src.repository import Repository
 from src.objects.factory import ObjectFactory
+from src.objects.commit import Commit
+from src.objects.blob import Blob
+from src.objects.base import ObjectValidationError, MMAP_THRESHOLD, store_blobs
 
 class TestCommands(unittest.TestCase):
     def setUp(self):
@@ -473,6 +481,268 @@ class TestCommandEdgeCases(unittest.TestCase):
              patch('sys.stderr', new_callable=StringIO):
             return command_func(args)
 
+class TestCommandInternals(unittest.TestCase):
+    """Tests for the helpers behind commit, log, cat-file and the CLI"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="mygit_internals_")
+        self.original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+
+        self.repo = Repository()
+        self.repo.create()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        import shutil
+        shutil.rmtree(self.test_dir)
+
+    def _commit(self, message: str) -> str:
+        """Run commit and return its output"""
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertTrue(cmd_commit(SimpleNamespace(message=message)))
+        return stdout.getvalue()
+
+    def _create_old_file(self, filename: str, content: str) -> Path:
+        """Create a file whose mtime is well outside the racy window"""
+        path = Path(filename)
+        path.write_text(content)
+        old = time.time() - 60
+        os.utime(path, (old, old))
+        return path
+
+    def _write_commit(self, message: str, timestamp: int, parents=()) -> str:
+        """Store a commit object directly and return its SHA"""
+        commit = Commit()
+        commit.tree = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+        commit.author = "Test User <test@example.com>"
+        commit.committer = "Test User <test@example.com>"
+        commit.message = message
+        commit.timestamp = timestamp
+        commit.parents = list(parents)
+        return ObjectFactory.get_instance().write_object(self.repo, commit)
+
+    def _log(self, **kwargs) -> str:
+        """Run log with --oneline and return its output"""
+        args = SimpleNamespace(all=False, oneline=True)
+        for key, value in kwargs.items():
+            setattr(args, key, value)
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertTrue(cmd_log(args))
+        return stdout.getvalue()
+
+    def _assert_listed_in_order(self, output: str, shas):
+        positions = [output.index(sha[:7]) for sha in shas]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_commit_blob_cache_skips_racy_files(self):
+        """Files modified just before a commit are not cached"""
+        self._create_old_file("old.txt", "settled")
+        Path("new.txt").write_text("just written")
+
+        self._commit("first")
+
+        cache = _load_blob_cache(self.repo)
+        self.assertIn("old.txt", cache['files'])
+        self.assertNotIn("new.txt", cache['files'])
+
+    def test_commit_blob_cache_skips_unchanged_files(self):
+        """Cached files are not hashed again; changed ones are"""
+        self._create_old_file("a.txt", "alpha")
+        self._create_old_file("b.txt", "beta")
+        self._commit("first")
+
+        self._create_old_file("a.txt", "alpha, edited")
+        with patch('src.commands.commit.store_blobs', wraps=store_blobs) as store:
+            self._commit("second")
+        self.assertEqual(store.call_args[0][0], [Path("a.txt")])
+
+    def test_commit_blob_cache_reuses_tree(self):
+        """An unchanged working tree reuses the recorded tree"""
+        self._create_old_file("a.txt", "alpha")
+        self._create_old_file("b.txt", "beta")
+
+        first = self._commit("first")
+        tree_sha = _load_blob_cache(self.repo)['tree']
+        self.assertIn(f"Tree: {tree_sha}", first)
+
+        with patch.object(ObjectFactory, 'write_object',
+                          autospec=True, side_effect=ObjectFactory.write_object) as write:
+            second = self._commit("second")
+        self.assertIn(f"Tree: {tree_sha}", second)
+        # Only the commit itself is written
+        self.assertEqual([type(call[0][2]).__name__ for call in write.call_args_list], ['Commit'])
+
+    def test_commit_blob_cache_drops_tree_with_racy_files(self):
+        """A tree built from a racy file is not recorded for reuse"""
+        self._create_old_file("old.txt", "settled")
+        Path("new.txt").write_text("just written")
+
+        self._commit("first")
+        self.assertIsNone(_load_blob_cache(self.repo)['tree'])
+
+    def test_log_follows_head(self):
+        """log walks first parents from HEAD and ignores other commits"""
+        root = self._write_commit("root", 100)
+        child = self._write_commit("child", 200, [root])
+        other = self._write_commit("unrelated", 300)
+        (self.repo.gitdir / "refs" / "heads" / "main").write_text(child + "\n")
+
+        output = self._log()
+        self.assertIn(f"{child[:7]} child", output)
+        self.assertIn(f"{root[:7]} root", output)
+        self.assertNotIn(other[:7], output)
+        self._assert_listed_in_order(output, [child, root])
+
+    def test_log_all_scans_object_store(self):
+        """log --all, and log on an unborn branch, list every commit newest first"""
+        root = self._write_commit("root", 100)
+        child = self._write_commit("child", 200, [root])
+        other = self._write_commit("unrelated", 300)
+
+        unborn = self._log()
+        (self.repo.gitdir / "refs" / "heads" / "main").write_text(child + "\n")
+        output = self._log(all=True)
+
+        for text in (unborn, output):
+            self._assert_listed_in_order(text, [other, child, root])
+
+    def test_log_all_orders_same_second_commits(self):
+        """Commits sharing a timestamp list children before their parents"""
+        root = self._write_commit("root", 100)
+        child = self._write_commit("child", 100, [root])
+        grandchild = self._write_commit("grandchild", 100, [child])
+
+        self._assert_listed_in_order(self._log(all=True), [grandchild, child, root])
+
+    def test_commit_advances_current_branch(self):
+        """commit records HEAD as its parent and moves the branch, so log sees it"""
+        Path("file.txt").write_text("first")
+        self._commit("first")
+        first = self.repo.get_HEAD()
+        Path("file.txt").write_text("second")
+        self._commit("second")
+        second = self.repo.get_HEAD()
+
+        self.assertNotEqual(first, second)
+        commit = ObjectFactory.get_instance().read_object(self.repo, second)
+        self.assertEqual(commit.parents, [first])
+        self._assert_listed_in_order(self._log(), [second, first])
+
+    def test_add_expands_globs(self):
+        """Globs expand recursively and absolutely, skip the gitdir and dedupe"""
+        Path("src/pkg").mkdir(parents=True)
+        for name in ("top.py", "src/a.py", "src/pkg/b.py", "notes.txt"):
+            Path(name).write_text(name)
+        (self.repo.gitdir / "hook.py").write_text("hook")
+
+        gitdir_name = self.repo.gitdir.name
+        expanded = _expand_arguments(["**/*.py", "src/a.py", "**/*.py"], gitdir_name)
+        self.assertEqual([path for path, _ in expanded],
+                         [os.path.join("src", "a.py"), os.path.join("src", "pkg", "b.py"), "top.py"])
+
+        pattern = os.path.join(os.getcwd(), "*.txt")
+        self.assertEqual([path for path, _ in _expand_arguments([pattern], gitdir_name)],
+                         [os.path.join(os.getcwd(), "notes.txt")])
+
+        for pattern in ("*.md", os.path.join(gitdir_name, "*.py")):
+            with patch('sys.stdout', new_callable=StringIO) as stdout:
+                self.assertEqual(_expand_arguments([pattern], gitdir_name), [])
+            self.assertIn(f"'{pattern}' matches no files", stdout.getvalue())
+
+    def test_hash_file_matches_git_blob_id(self):
+        """Files hash to the git id of their content, read or mapped"""
+        hasher = ObjectHasher()
+        for data in (b"", b"hello\n", os.urandom(MMAP_THRESHOLD + 1)):
+            with self.subTest(size=len(data)):
+                path = Path(f"blob_{len(data)}")
+                path.write_bytes(data)
+                expected = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+                self.assertEqual(hasher.hash_file(path), expected)
+
+    def test_hash_data_non_blob_types(self):
+        """Commits are hashed as given and stored; malformed trees are rejected"""
+        body = (b"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+                b"author A <a@example.com> 1 +0000\n"
+                b"committer A <a@example.com> 1 +0000\n\nmessage\n")
+        serialized = b"commit %d\0" % len(body) + body
+
+        sha = ObjectHasher(self.repo).hash_data(body, "commit", create=True)
+        self.assertEqual(sha, hashlib.sha1(serialized).hexdigest())
+        stored = self.repo.gitdir / "objects" / sha[:2] / sha[2:]
+        self.assertEqual(zlib.decompress(stored.read_bytes()), serialized)
+
+        with self.assertRaises(ObjectValidationError):
+            ObjectHasher().hash_data(b"not a tree", "tree")
+
+    def _cat_file_pretty(self, sha: str) -> str:
+        """Run cat-file -p with a text-only stdout and return its output"""
+        args = SimpleNamespace(objects=[sha], batch=False, batch_check=False,
+                               size=False, type=False, pretty_print=True,
+                               stream=False, verbose=False)
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertTrue(cmd_cat_file(args))
+        return stdout.getvalue()
+
+    def test_cat_file_pretty_streams_text_blob(self):
+        """Text blobs are streamed whole, even past the in-memory spool size"""
+        for text in ("short text\n", "caf\u00e9 \u2603\n" * (TEXT_BLOB_SPOOL_SIZE // 7)):
+            with self.subTest(length=len(text)):
+                sha = ObjectFactory.get_instance().write_object(
+                    self.repo, Blob(text.encode('utf-8')))
+                self.assertEqual(self._cat_file_pretty(sha), text)
+
+    def test_cat_file_pretty_detects_binary_anywhere(self):
+        """A blob is binary when any part of it fails to decode as UTF-8"""
+        for data in (b"caf\xe9\n", b"a" * 100000 + b"\xff"):
+            with self.subTest(length=len(data)):
+                sha = ObjectFactory.get_instance().write_object(self.repo, Blob(data))
+                self.assertEqual(self._cat_file_pretty(sha),
+                                 f"[Binary data: {len(data)} bytes]\n")
+
+    def test_short_sha_resolution(self):
+        """Abbreviated SHAs resolve when unique and are rejected when ambiguous"""
+        prefix_dir = self.repo.gitdir / "objects" / "ab"
+        prefix_dir.mkdir(parents=True)
+        for name in ("cdef01" + "0" * 32, "cdef02" + "0" * 32, "ff" + "0" * 36):
+            (prefix_dir / name).touch()
+
+        self.assertEqual(_handle_short_sha(self.repo, "abcdef01"), "abcdef01" + "0" * 32)
+        self.assertEqual(_handle_short_sha(self.repo, "abff"), "abff" + "0" * 36)
+        self.assertIsNone(_handle_short_sha(self.repo, "abcd99"))
+        self.assertIsNone(_handle_short_sha(self.repo, "1234"))
+        with self.assertRaises(ValueError):
+            _handle_short_sha(self.repo, "abcdef0")
+
+    def test_sniff_subcommand(self):
+        """The subcommand is found after global options and their values"""
+        self.assertEqual(_sniff_subcommand(["mygit", "log", "--all"]), "log")
+        self.assertEqual(
+            _sniff_subcommand(["mygit", "--log-file", "out.log", "-v", "cat-file", "-p"]),
+            "cat-file"
+        )
+        self.assertIsNone(_sniff_subcommand(["mygit", "--version"]))
+        self.assertIsNone(_sniff_subcommand(["mygit", "--log-file"]))
+
+    def test_load_commands_narrows_to_subcommand(self):
+        """Only the invoked subcommand's parser is built"""
+        self.assertEqual(load_commands(['log']).list_commands(), ['log'])
+        # Aliases and typos are not command names, so everything is loaded
+        self.assertEqual(len(load_commands(['stage']).list_commands()),
+                         len(load_commands().list_commands()))
+
+    def test_lazy_commands_table(self):
+        """COMMANDS resolves entries on lookup"""
+        self.assertEqual(
+            sorted(COMMANDS),
+            ['add', 'cat-file', 'commit', 'hash-object', 'init', 'log']
+        )
+        self.assertIn('log', COMMANDS)
+        self.assertNotIn('stage', COMMANDS)
+        self.assertIs(COMMANDS['log'][0], cmd_log)
+        with self.assertRaises(KeyError):
+            COMMANDS['stage']
+
 def run_performance_benchmarks():
     """Run performance benchmarks (not a test)"""
     import timeit
@@ -2,7 +2,10 @@ import unittest
 import tempfile
 import os
 import time
+import errno
 import hashlib
+import stat
+import zlib
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
@@ -15,7 +18,9 @@ from src.objects.blob import Blob
 from src.objects.commit import Commit
 from src.objects.tree import Tree, TreeEntry
 from src.objects.factory import ObjectFactory
-from src.objects.base import GitObject, ObjectValidationError
+from src.objects import base
+from src.objects.base import (GitObject, ObjectValidationError, LooseObjectFile,
+                              LOOSE_OBJECT_MODE, MMAP_THRESHOLD, store_blob)
 from src.repository import Repository
 
 class TestBlob(unittest.TestCase):
@@ -326,6 +331,20 @@ class TestTree(unittest.TestCase):
         with self.assertRaises(ValueError):
             tree.add_entry("invalid_mode", "test.txt", self.file_sha)
 
+    def test_tree_canonical_order(self):
+        """Entries serialize in git order, directories sorting as name + '/'"""
+        tree = Tree()
+        tree.add_entry(self.file_mode, "a.txt", self.file_sha)
+        tree.add_entry(self.dir_mode, "a", self.tree_sha)
+        tree.add_entry(self.file_mode, "a-b", self.file_sha)
+
+        # '-' < '.' < '/', so the directory "a" sorts last
+        serialized = tree.serialize()
+        positions = [serialized.index(b" %s\0" % name) for name in (b"a-b", b"a.txt", b"a")]
+        self.assertEqual(positions, sorted(positions))
+        # Object id from `git mktree --missing` for the same entries
+        self.assertEqual(tree.get_hash(), "bddc73062d2822a2ff86bb8e284b0bdd33ba77a5")
+
     def test_tree_merging(self):
         """Test tree merging"""
         tree1 = Tree()
@@ -578,6 +597,111 @@ class TestObjectEdgeCases(unittest.TestCase):
         commit = Commit()
         self.assertNotEqual(blob1, commit)
 
+class TestLooseObjectStore(unittest.TestCase):
+    """Tests for writing and reading loose object files"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="mygit_loose_")
+        self.original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+
+        self.repo = Repository()
+        self.repo.create()
+        self.objects_dir = self.repo.gitdir / "objects"
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        import shutil
+        shutil.rmtree(self.test_dir)
+
+    def _stored_files(self):
+        """Every file under objects/, temporary files included"""
+        return sorted(p.relative_to(self.objects_dir).as_posix()
+                      for p in self.objects_dir.rglob("*") if p.is_file())
+
+    def _publish(self, data: bytes) -> Path:
+        """Write data through LooseObjectFile and publish it"""
+        obj_path = self.objects_dir / "ab" / ("c" * 38)
+        with LooseObjectFile(self.objects_dir) as f:
+            f.write(data)
+            self.assertFalse(obj_path.exists())  # Invisible until published
+            f.publish(obj_path)
+        return obj_path
+
+    def _assert_published(self, obj_path: Path, data: bytes):
+        self.assertEqual(obj_path.read_bytes(), data)
+        self.assertEqual(self._stored_files(), ["ab/" + "c" * 38])
+        if os.name != 'nt':
+            self.assertEqual(stat.S_IMODE(obj_path.stat().st_mode), LOOSE_OBJECT_MODE)
+
+    def test_publish_named_tmpfile(self):
+        """Named temporary files are renamed into place read-only"""
+        with patch('src.objects.base._link_unnamed_tmpfiles', False):
+            obj_path = self._publish(b"named")
+        self._assert_published(obj_path, b"named")
+
+    def test_publish_falls_back_when_link_refused(self):
+        """A refused /proc link copies to a named file and stops linking"""
+        if not hasattr(os, 'O_TMPFILE') or not os.path.isdir('/proc/self/fd'):
+            self.skipTest("O_TMPFILE not available")
+
+        refused = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch('src.objects.base._link_unnamed_tmpfiles', True), \
+             patch('src.objects.base.os.link', side_effect=refused):
+            obj_path = self._publish(b"unnamed")
+            self.assertFalse(base._link_unnamed_tmpfiles)
+        self._assert_published(obj_path, b"unnamed")
+
+    def test_unpublished_file_is_discarded(self):
+        """Leaving the with block without publishing leaves nothing behind"""
+        with patch('src.objects.base._link_unnamed_tmpfiles', False):
+            with LooseObjectFile(self.objects_dir) as f:
+                f.write(b"partial")
+        self.assertEqual(self._stored_files(), [])
+
+    def test_store_blob_matches_git_hash(self):
+        """store_blob hashes like git for both the small and mmap paths"""
+        for size in (0, 13, MMAP_THRESHOLD + 5):
+            with self.subTest(size=size):
+                data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+                path = Path(f"file_{size}")
+                path.write_bytes(data)
+
+                expected = hashlib.sha1(b"blob %d\0" % size + data).hexdigest()
+                sha = store_blob(path, self.objects_dir, chunk_size=4096)
+                self.assertEqual(sha, expected)
+
+                stored = self.objects_dir / sha[:2] / sha[2:]
+                self.assertEqual(zlib.decompress(stored.read_bytes()),
+                                 b"blob %d\0" % size + data)
+
+                # An object already in the store is not compressed again
+                with patch('src.objects.base.LooseObjectFile') as loose:
+                    self.assertEqual(store_blob(path, self.objects_dir), sha)
+                loose.assert_not_called()
+
+    def test_open_object_stream(self):
+        """open_object_stream yields the inflated object in bounded chunks"""
+        data = b"line of text\n" * 1000
+        sha = ObjectFactory.get_instance().write_object(self.repo, Blob(data))
+
+        chunks = list(ObjectFactory.open_object_stream(self.repo, sha, chunk_size=512))
+        self.assertTrue(all(len(chunk) <= 512 for chunk in chunks))
+        self.assertEqual(b''.join(chunks), b"blob %d\0" % len(data) + data)
+
+        with self.assertRaises(FileNotFoundError):
+            list(ObjectFactory.open_object_stream(self.repo, "0" * 40))
+
+    def test_read_header(self):
+        """read_header reports type and size without inflating the body"""
+        data = b"line of text\n" * 1000
+        sha = ObjectFactory.get_instance().write_object(self.repo, Blob(data))
+
+        self.assertEqual(ObjectFactory.read_header(self.repo, sha), ('blob', len(data)))
+
+        with self.assertRaises(FileNotFoundError):
+            ObjectFactory.read_header(self.repo, "0" * 40)
+
 if __name__ == "__main__":
     # Run tests with increased verbosity
     unittest.main(verbosity=2)
@@ -12,7 +12,7 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.repository import Repository, RepositoryError, RepositoryType, ObjectFormat
+from src.repository import Repository, RepositoryError, RepositoryType, ObjectFormat, ConfigManager
 from src.objects.blob import Blob
 from src.objects.factory import ObjectFactory
 
@@ -129,6 +129,23 @@ class TestRepository(unittest.TestCase):
             self.assertIn('object_stats', validation_results)
             self.assertIn('ref_stats', validation_results)
 
+    def test_repository_object_validation(self):
+        """Test that stored objects are read back and corrupt ones counted"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Repository(temp_dir)
+            repo.create()
+            
+            ObjectFactory.get_instance().write_object(repo, Blob(b"valid content"))
+            corrupt = repo.gitdir / "objects" / "ab" / ("c" * 38)
+            corrupt.parent.mkdir()
+            corrupt.write_bytes(b"not zlib data")
+            
+            stats = repo.validate()['object_stats']
+            self.assertEqual(stats['total_objects'], 2)
+            self.assertEqual(stats['valid_objects'], 1)
+            self.assertEqual(stats['corrupt_objects'], 1)
+            self.assertEqual(stats['object_types'], {'blob': 1})
+
     def test_repository_branch_management(self):
         """Test branch management"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -641,6 +658,55 @@ class TestRepositoryRecovery(unittest.TestCase):
         validation_results = repo.validate()
         self.assertFalse(validation_results['structure_valid'])
 
+class TestConfigManager(unittest.TestCase):
+    """Test configuration reads and batched writes"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="repo_config_")
+        self.repo = Repository(self.test_dir)
+        self.repo.create()
+        self.config = ConfigManager(self.repo.gitdir)
+
+    def tearDown(self):
+        import shutil
+        try:
+            shutil.rmtree(self.test_dir)
+        except OSError:
+            pass
+
+    def test_set_saves_immediately(self):
+        """Outside a batch every set() writes the config file"""
+        with patch.object(self.config, 'save', wraps=self.config.save) as save:
+            self.config.set('user', 'name', 'Test User')
+            self.config.set('user', 'email', 'test@example.com')
+        self.assertEqual(save.call_count, 2)
+
+    def test_batch_saves_once(self):
+        """A batch, nested or not, writes the config file once at the end"""
+        with patch.object(self.config, 'save', wraps=self.config.save) as save:
+            with self.config.batch():
+                self.config.set('user', 'name', 'Test User')
+                with self.config.batch():
+                    self.config.set('user', 'email', 'test@example.com')
+                self.assertEqual(save.call_count, 0)
+        self.assertEqual(save.call_count, 1)
+
+        reloaded = ConfigManager(self.repo.gitdir)
+        self.assertEqual(reloaded.get('user', 'name'), 'Test User')
+        self.assertEqual(reloaded.get('user', 'email'), 'test@example.com')
+
+        # Later writes are no longer deferred
+        self.config.set('user', 'name', 'Other User')
+        self.assertEqual(ConfigManager(self.repo.gitdir).get('user', 'name'), 'Other User')
+
+    def test_batch_skips_save_on_error(self):
+        """An exception inside a batch skips the deferred write"""
+        with self.assertRaises(RuntimeError):
+            with self.config.batch():
+                self.config.set('user', 'name', 'Test User')
+                raise RuntimeError("interrupted")
+        self.assertIsNone(ConfigManager(self.repo.gitdir).get('user', 'name'))
+
 if __name__ == "__main__":
     # Run tests with increased verbosity
     unittest.main(verbosity=2)